@@ -1,14 +1,28 @@
+from importlib import import_module
+
 from fastapi import APIRouter
-from app.api.v1 import transcripts, transcripts_ws, analysis, scripts, files, calls
+
+from app.core.config import settings
+
+# 라우터 모듈별 include 옵션 (이 순서대로 등록, prefix/tags가 없으면 라우터 자체 설정 사용)
+ROUTERS = {
+    "transcripts": {"prefix": "/transcripts", "tags": ["transcripts"]},
+    "transcripts_ws": {"prefix": "/transcripts", "tags": ["transcripts-ws"]},
+    "analysis": {"prefix": "/analysis", "tags": ["analysis"]},
+    "scripts": {},
+    "files": {},
+    "calls": {},
+}
+
+unknown = set(settings.enabled_routers) - ROUTERS.keys()
+if unknown:
+    raise ValueError(f"ENABLED_ROUTERS에 알 수 없는 라우터가 있습니다: {', '.join(sorted(unknown))}")
 
 api_router = APIRouter()
 
-# Include sub-routers
-api_router.include_router(transcripts.router, prefix="/transcripts", tags=["transcripts"])
-api_router.include_router(transcripts_ws.router, prefix="/transcripts", tags=["transcripts-ws"])
-api_router.include_router(analysis.router, prefix="/analysis", tags=["analysis"])
-api_router.include_router(scripts.router)
-api_router.include_router(files.router)
-api_router.include_router(calls.router)
+# Include sub-routers (설정에 포함된 모듈만 import)
+for name, options in ROUTERS.items():
+    if name in settings.enabled_routers:
+        api_router.include_router(import_module(f"app.api.v1.{name}").router, **options)
 
 __all__ = ["api_router"]
@@ -1,21 +1,29 @@
 """API endpoints for call analysis (MVP)"""
 
-from typing import Optional, List
-import os
+from typing import Optional, List, Dict, Tuple, Callable, Awaitable, Any
+import asyncio
+import hashlib
+import json
 import uuid
 from pathlib import Path
-from fastapi import APIRouter, Query, Body, UploadFile, File, Form, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Query, Body, UploadFile, File, Form, HTTPException, Depends, Request, Header
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from cachetools import TTLCache
 from app.schemas.analysis import (
     ComprehensiveAnalysis,
     AISummaryResponse,
     ResponseFeedbackResponse
 )
 from app.services.analysis_service import analysis_service
-from app.services.stt_service_async import AsyncSTTService
-from app.core.config import settings
+from app.services.stt_service_async import async_stt_service
+from app.core.cache import result_cache
 from app.utils.audio import get_audio_duration_ms
+from app.utils.upload import get_scratch_dir, remove_file, save_upload_file
 from app.core.exceptions import (
+    CallMateException,
     AnalysisError,
     SummaryError,
     FeedbackError,
@@ -24,10 +32,180 @@ from app.core.exceptions import (
 
 router = APIRouter()
 
-# In-memory cache
-summary_cache = {}
-feedback_cache = {}
-analysis_cache = {}
+# 분석 결과 캐시는 app.core.cache.result_cache (REDIS_URL 설정 시 워커 간 공유)
+
+# 전처리 결과 캐시 (전사 콘텐츠 해시 → _prepare_analysis_data 결과, 워커별)
+prepared_cache = TTLCache(maxsize=256, ttl=600)
+
+# 진행 중인 LLM 호출 (같은 키의 동시 요청은 하나의 호출 결과를 공유)
+_inflight: Dict[str, asyncio.Future] = {}
+
+# 워커 간 중복 계산 방지 락 (종합 분석 최대 소요 시간 기준) / 대기 중 캐시 확인 간격
+LOCK_TTL_SECONDS = 120
+LOCK_POLL_SECONDS = 0.5
+
+# 분석 결과는 사용자별 데이터 → 공유 캐시(프록시) 저장 금지, 클라이언트는 ETag로 재검증 후 재사용
+CACHE_CONTROL = "private, no-cache"
+
+# 업로드 허용 음성 확장자
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a"})
+
+
+async def _wait_for_result(cache_key: str) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    다른 워커가 계산 중인 결과가 공유 캐시에 저장될 때까지 대기
+
+    보유자가 결과 없이 락을 해제하면(계산 실패 등) 기한까지 기다리지 않고 락을 획득합니다.
+
+    Returns:
+        (캐시된 결과, None) 또는 (None, 획득한 락 토큰) / 시간 초과 시 (None, None)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + LOCK_TTL_SECONDS
+    while loop.time() < deadline:
+        await asyncio.sleep(LOCK_POLL_SECONDS)
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            return cached, None
+
+        lock_token = await result_cache.acquire_lock(cache_key, LOCK_TTL_SECONDS)
+        if lock_token is not None:
+            # 조회 직후 보유자가 저장하고 해제했을 수 있으므로 한 번 더 확인
+            cached = await result_cache.get(cache_key)
+            if cached is not None:
+                await result_cache.release_lock(cache_key, lock_token)
+                return cached, None
+            return None, lock_token
+    return None, None
+
+
+async def _compute_and_store(
+    cache_key: str,
+    compute: Callable[[], Awaitable[BaseModel]]
+) -> bytes:
+    """
+    계산 후 직렬화하여 공유 캐시에 저장 (직렬화된 JSON bytes 반환)
+
+    다른 워커가 같은 키를 계산 중이면 그 결과를 기다려 재사용합니다.
+    """
+    lock_token = await result_cache.acquire_lock(cache_key, LOCK_TTL_SECONDS)
+    if lock_token is None:
+        cached, lock_token = await _wait_for_result(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        result = await compute()
+        body = result.model_dump_json().encode()
+        await result_cache.set(cache_key, body)
+        return body
+    finally:
+        if lock_token is not None:
+            await result_cache.release_lock(cache_key, lock_token)
+
+
+async def _single_flight(
+    cache_key: str,
+    compute: Callable[[], Awaitable[BaseModel]]
+) -> bytes:
+    """
+    캐시 조회 → 진행 중인 호출 합류 → 새로 계산 순서로 결과(JSON bytes) 반환
+
+    동일한 전사 데이터로 동시에 여러 요청이 들어와도 LLM은 한 번만 호출됩니다.
+    요청한 클라이언트가 연결을 끊어도 계산은 계속되어 다른 대기자에게 전달됩니다.
+    캐시 적중 시 저장된 bytes를 그대로 반환하여 검증/직렬화를 건너뜁니다.
+    """
+    cached = await result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    fut = _inflight.get(cache_key)
+    if fut is None:
+        fut = asyncio.ensure_future(_compute_and_store(cache_key, compute))
+        _inflight[cache_key] = fut
+
+        def _on_done(done: asyncio.Future):
+            _inflight.pop(cache_key, None)
+            # 대기자가 모두 끊긴 경우에도 예외 미조회 경고가 남지 않도록 확인
+            if not done.cancelled():
+                done.exception()
+
+        fut.add_done_callback(_on_done)
+
+    return await asyncio.shield(fut)
+
+
+def _json_response(body: bytes, if_none_match: Optional[str]) -> Response:
+    """
+    직렬화된 결과를 ETag와 함께 응답
+
+    클라이언트가 같은 결과를 이미 가지고 있으면(If-None-Match 일치) 본문 없이 304를 반환합니다.
+    """
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        "Cache-Control": CACHE_CONTROL
+    }
+    if if_none_match and _etag_matches(headers["ETag"], if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    If-None-Match 비교 (RFC 9110 약한 비교)
+
+    - `*`: 현재 결과가 있으면 항상 일치
+    - 쉼표로 구분된 태그 목록 중 하나라도 같으면 일치 (`W/` 접두어 무시)
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _sse(payload: dict) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def _sse_response(
+    cache_key: str,
+    stream_factory: Callable[[], Any],
+    parse: Callable[[str], Any],
+    error_cls: type
+) -> StreamingResponse:
+    """
+    LLM 스트리밍 응답을 SSE로 전달하고, 완료 시 파싱 결과를 캐시에 저장
+
+    이벤트 형식:
+    - `{"delta": "..."}`: LLM 응답 텍스트 조각
+    - `{"done": true, "result": {...}}`: 최종 결과 (일반 API 응답과 동일)
+    - `{"error": {"code": "...", "message": "..."}}`: 오류
+    """
+    async def event_stream():
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            yield _sse({"done": True, "result": json.loads(cached)})
+            return
+
+        chunks = []
+        try:
+            async for delta in await stream_factory():
+                chunks.append(delta)
+                yield _sse({"delta": delta})
+            result = parse("".join(chunks))
+        except Exception as e:
+            error: CallMateException = error_cls(str(e))
+            yield _sse({"error": {"code": error.code, "message": error.message}})
+            return
+
+        await result_cache.set(cache_key, result.model_dump_json().encode())
+        yield _sse({"done": True, "result": result.model_dump(mode="json")})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # ============================================
@@ -51,63 +229,114 @@ class AnalysisRequest(BaseModel):
     consultation_type: str = "sales"
 
 
-def _prepare_analysis_data(request: AnalysisRequest):
-    """분석을 위한 데이터 전처리"""
-    utterances_dict = [u.model_dump() for u in request.utterances]
-
-    # 대화 포맷 생성
-    conversation_formatted = "\n".join(
-        f"{u['speaker']}: {u['text']}" for u in utterances_dict
-    )
-
-    # 화자별 세그먼트
-    speaker_segments = []
-    for speaker in request.speakers:
-        speaker_utterances = [u for u in utterances_dict if u["speaker"] == speaker]
-        full_text = " ".join(u["text"] for u in speaker_utterances)
-        speaker_segments.append({
-            "speaker": speaker,
-            "full_text": full_text,
-            "utterances": speaker_utterances
-        })
+async def _parse_analysis_request(request: Request) -> AnalysisRequest:
+    """
+    요청 본문(raw JSON bytes)을 pydantic-core에서 한 번에 파싱·검증
 
-    # 상담사(나) / 상대방 결정
-    if request.my_speaker and request.my_speaker in request.speakers:
-        # 프론트에서 지정한 경우
-        agent_speaker = request.my_speaker
-        other_speakers = [s for s in request.speakers if s != agent_speaker]
-    else:
-        # 휴리스틱 fallback (my_speaker 없을 때)
-        customer_speaker = analysis_service._detect_customer_speaker(
-            speaker_segments, utterances_dict
-        )
-        agent_speaker = [s for s in request.speakers if s != customer_speaker][0] if len(request.speakers) > 1 else request.speakers[0]
-        other_speakers = [s for s in request.speakers if s != agent_speaker]
-
-    # 상대방(들) 텍스트 추출
-    other_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] in other_speakers:
-            other_text += seg["full_text"] + " "
-
-    # 상담사 텍스트 추출
-    agent_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] == agent_speaker:
-            agent_text = seg["full_text"]
-            break
+    FastAPI 기본 경로(json.loads → dict → 검증)의 중간 dict 생성을 건너뜁니다.
+    검증 실패 시 FastAPI와 동일한 422 응답을 반환합니다.
+    """
+    try:
+        return AnalysisRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
+
+def _openapi_body(model: type) -> dict:
+    """raw body를 직접 검증하는 엔드포인트의 Swagger 문서용 requestBody"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {k: inline(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [inline(v) for v in node]
+        return node
 
     return {
-        "utterances": utterances_dict,
-        "speaker_segments": speaker_segments,
-        "conversation_formatted": conversation_formatted,
-        "agent_speaker": agent_speaker,
-        "other_speakers": other_speakers,
-        "agent_text": agent_text,
-        "other_text": other_text.strip()
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}}
+        }
     }
 
 
+ANALYSIS_REQUEST_BODY = _openapi_body(AnalysisRequest)
+
+
+def _transcript_digest(request: AnalysisRequest) -> str:
+    """전사 데이터(발화/화자/상담사 지정) 기반 콘텐츠 해시"""
+    return hashlib.blake2b(
+        request.model_dump_json(include={"utterances", "speakers", "my_speaker"}).encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+def _ctx_key(value: Optional[str]) -> str:
+    """스크립트 컨텍스트 등 긴 문자열을 캐시 키용 64비트 해시로 변환 (프로세스 간 동일)"""
+    return hashlib.blake2b((value or "").encode(), digest_size=8).hexdigest()
+
+
+def _request_key(kind: str, digest: str, *options: str) -> str:
+    """
+    요청 내용 기반 캐시 키: `{kind}:{전사 해시}:{옵션...}`
+
+    전사 해시를 접두어로 두어 같은 전사의 캐시 항목을 한 번에 찾을 수 있습니다.
+    """
+    return ":".join((kind, digest, *options))
+
+
+async def _get_prepared_data(
+    request: AnalysisRequest,
+    digest: str,
+    need_segments: bool = True
+) -> dict:
+    """
+    전처리 결과 조회 (같은 전사로 요약/피드백/종합 분석을 연달아 호출하면 재사용)
+
+    need_segments=False(요약/피드백)는 세그먼트가 포함된 전체 결과가 있으면 그것을 재사용합니다.
+    반환값은 여러 요청이 공유하므로 수정하지 않아야 합니다.
+    """
+    data = prepared_cache.get(digest)
+    if data is None and not need_segments:
+        data = prepared_cache.get(f"{digest}:text")
+    if data is None:
+        data = await run_in_threadpool(_prepare_analysis_data, request, need_segments)
+        prepared_cache[digest if need_segments else f"{digest}:text"] = data
+    return data
+
+
+def _prepare_analysis_data(request: AnalysisRequest, need_segments: bool = True) -> dict:
+    """
+    분석을 위한 데이터 전처리 (analysis_service.prepare_analysis_data)
+
+    요청 모델의 발화를 서비스 입력용 dict로 한 번만 변환합니다.
+    (model_dump() 대신 속성을 직접 읽음)
+    """
+    utterances = [
+        {
+            "speaker": u.speaker,
+            "text": u.text,
+            "start": u.start,
+            "end": u.end,
+            "confidence": u.confidence
+        }
+        for u in request.utterances
+    ]
+    return analysis_service.prepare_analysis_data(
+        utterances=utterances,
+        speakers=request.speakers,
+        my_speaker=request.my_speaker,
+        need_segments=need_segments
+    )
+
+
 # ============================================
 # 1. AI 요약 API
 # ============================================
@@ -116,9 +345,13 @@ def _prepare_analysis_data(request: AnalysisRequest):
     "/summary",
     response_model=AISummaryResponse,
     summary="AI 요약",
-    description="고객 니즈와 대화 핵심을 90자 이내로 요약합니다."
+    description="고객 니즈와 대화 핵심을 90자 이내로 요약합니다.",
+    openapi_extra=ANALYSIS_REQUEST_BODY
 )
-async def get_summary(request: AnalysisRequest):
+async def get_summary(
+    request: AnalysisRequest = Depends(_parse_analysis_request),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     AI 요약 (500px × 3줄, 16px 폰트 = 최대 90자)
 
@@ -130,18 +363,57 @@ async def get_summary(request: AnalysisRequest):
     - `summary`: 90자 이내 요약
     - `customer_state`: 고객 현재 상태
     """
-    data = _prepare_analysis_data(request)
+    digest = _transcript_digest(request)
 
-    try:
-        summary = await analysis_service.generate_summary(
+    async def compute():
+        data = await _get_prepared_data(request, digest, need_segments=False)
+        return await analysis_service.generate_summary(
             transcript_id="from_request",
             conversation_formatted=data["conversation_formatted"],
             customer_text=data["other_text"]  # 상대방 텍스트
         )
+
+    try:
+        body = await _single_flight(_request_key("summary", digest), compute)
     except Exception as e:
         raise SummaryError(str(e)).to_http_exception()
 
-    return summary
+    return _json_response(body, if_none_match)
+
+
+@router.post(
+    "/summary/stream",
+    summary="AI 요약 (스트리밍)",
+    description="AI 요약을 Server-Sent Events로 토큰 단위 스트리밍합니다.",
+    openapi_extra=ANALYSIS_REQUEST_BODY
+)
+async def stream_summary(request: AnalysisRequest = Depends(_parse_analysis_request)):
+    """
+    AI 요약 스트리밍 (SSE)
+
+    요청 Body는 `/summary`와 동일합니다.
+    첫 토큰부터 바로 전달되므로 체감 대기 시간이 짧습니다.
+
+    ## 이벤트
+    - `data: {"delta": "..."}`: 생성 중인 텍스트 조각
+    - `data: {"done": true, "result": {...}}`: 최종 요약 (`/summary` 응답과 동일)
+    - `data: {"error": {"code": "...", "message": "..."}}`: 오류
+    """
+    digest = _transcript_digest(request)
+
+    async def stream_factory():
+        data = await _get_prepared_data(request, digest, need_segments=False)
+        return analysis_service.stream_summary(
+            conversation_formatted=data["conversation_formatted"],
+            customer_text=data["other_text"]
+        )
+
+    return _sse_response(
+        cache_key=_request_key("summary", digest),
+        stream_factory=stream_factory,
+        parse=lambda content: analysis_service.parse_summary("from_request", content),
+        error_cls=SummaryError
+    )
 
 
 # ============================================
@@ -152,9 +424,13 @@ async def get_summary(request: AnalysisRequest):
     "/feedback",
     response_model=ResponseFeedbackResponse,
     summary="응대 피드백",
-    description="상담 유형별 3가지 추천 멘트를 제공합니다."
+    description="상담 유형별 3가지 추천 멘트를 제공합니다.",
+    openapi_extra=ANALYSIS_REQUEST_BODY
 )
-async def get_feedback(request: AnalysisRequest):
+async def get_feedback(
+    request: AnalysisRequest = Depends(_parse_analysis_request),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     응대 피드백 (상담 유형별 3가지 추천)
 
@@ -174,20 +450,66 @@ async def get_feedback(request: AnalysisRequest):
     if request.consultation_type not in valid_types:
         raise InvalidConsultationTypeError().to_http_exception()
 
-    data = _prepare_analysis_data(request)
+    digest = _transcript_digest(request)
 
-    try:
-        feedback = await analysis_service.generate_feedback(
+    async def compute():
+        data = await _get_prepared_data(request, digest, need_segments=False)
+        return await analysis_service.generate_feedback(
             transcript_id="from_request",
             conversation_formatted=data["conversation_formatted"],
             customer_text=data["other_text"],  # 상대방 텍스트
             consultation_type=request.consultation_type,
             script_context=request.script_context
         )
+
+    cache_key = _request_key(
+        "feedback", digest, request.consultation_type, _ctx_key(request.script_context)
+    )
+    try:
+        body = await _single_flight(cache_key, compute)
     except Exception as e:
         raise FeedbackError(str(e)).to_http_exception()
 
-    return feedback
+    return _json_response(body, if_none_match)
+
+
+@router.post(
+    "/feedback/stream",
+    summary="응대 피드백 (스트리밍)",
+    description="응대 피드백을 Server-Sent Events로 토큰 단위 스트리밍합니다.",
+    openapi_extra=ANALYSIS_REQUEST_BODY
+)
+async def stream_feedback(request: AnalysisRequest = Depends(_parse_analysis_request)):
+    """
+    응대 피드백 스트리밍 (SSE)
+
+    요청 Body와 이벤트 형식은 `/feedback`, `/summary/stream`과 동일합니다.
+    """
+    valid_types = ["sales", "information", "complaint"]
+    if request.consultation_type not in valid_types:
+        raise InvalidConsultationTypeError().to_http_exception()
+
+    digest = _transcript_digest(request)
+
+    async def stream_factory():
+        data = await _get_prepared_data(request, digest, need_segments=False)
+        return analysis_service.stream_feedback(
+            conversation_formatted=data["conversation_formatted"],
+            customer_text=data["other_text"],
+            consultation_type=request.consultation_type,
+            script_context=request.script_context
+        )
+
+    return _sse_response(
+        cache_key=_request_key(
+            "feedback", digest, request.consultation_type, _ctx_key(request.script_context)
+        ),
+        stream_factory=stream_factory,
+        parse=lambda content: analysis_service.parse_feedback(
+            "from_request", content, request.consultation_type
+        ),
+        error_cls=FeedbackError
+    )
 
 
 # ============================================
@@ -198,9 +520,13 @@ async def get_feedback(request: AnalysisRequest):
     "/comprehensive",
     response_model=ComprehensiveAnalysis,
     summary="통화 종합 분석",
-    description="음성 통화를 AI로 종합 분석합니다."
+    description="음성 통화를 AI로 종합 분석합니다.",
+    openapi_extra=ANALYSIS_REQUEST_BODY
 )
-async def analyze_call(request: AnalysisRequest):
+async def analyze_call(
+    request: AnalysisRequest = Depends(_parse_analysis_request),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     통화 종합 분석
 
@@ -218,10 +544,11 @@ async def analyze_call(request: AnalysisRequest):
     - 대화 흐름 (턴별 분석, 전환점)
     - 추천 액션 및 멘트
     """
-    data = _prepare_analysis_data(request)
+    digest = _transcript_digest(request)
 
-    try:
-        analysis = await analysis_service.analyze_call(
+    async def compute():
+        data = await _get_prepared_data(request, digest)
+        return await analysis_service.analyze_call(
             transcript_id="from_request",
             conversation_formatted=data["conversation_formatted"],
             speaker_segments=data["speaker_segments"],
@@ -230,70 +557,20 @@ async def analyze_call(request: AnalysisRequest):
             other_speakers=data["other_speakers"],
             script_context=request.script_context
         )
+
+    cache_key = _request_key("analysis", digest, _ctx_key(request.script_context))
+    try:
+        body = await _single_flight(cache_key, compute)
     except Exception as e:
         raise AnalysisError(str(e)).to_http_exception()
 
-    return analysis
+    return _json_response(body, if_none_match)
 
 
 # ============================================
 # 4. 음성 파일 업로드 → 전사 → 분석 통합 API (HTTP)
 # ============================================
 
-def _prepare_analysis_data_from_dict(utterances: List[dict], speakers: List[str], my_speaker: Optional[str] = None):
-    """전사 결과 dict에서 분석 데이터 전처리"""
-    # 대화 포맷 생성
-    conversation_formatted = "\n".join(
-        f"{u['speaker']}: {u['text']}" for u in utterances
-    )
-
-    # 화자별 세그먼트
-    speaker_segments = []
-    for speaker in speakers:
-        speaker_utterances = [u for u in utterances if u["speaker"] == speaker]
-        full_text = " ".join(u["text"] for u in speaker_utterances)
-        speaker_segments.append({
-            "speaker": speaker,
-            "full_text": full_text,
-            "utterances": speaker_utterances
-        })
-
-    # 상담사(나) / 상대방 결정
-    if my_speaker and my_speaker in speakers:
-        agent_speaker = my_speaker
-        other_speakers = [s for s in speakers if s != agent_speaker]
-    else:
-        # 휴리스틱 fallback
-        customer_speaker = analysis_service._detect_customer_speaker(
-            speaker_segments, utterances
-        )
-        agent_speaker = [s for s in speakers if s != customer_speaker][0] if len(speakers) > 1 else speakers[0]
-        other_speakers = [s for s in speakers if s != agent_speaker]
-
-    # 상대방(들) 텍스트 추출
-    other_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] in other_speakers:
-            other_text += seg["full_text"] + " "
-
-    # 상담사 텍스트 추출
-    agent_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] == agent_speaker:
-            agent_text = seg["full_text"]
-            break
-
-    return {
-        "utterances": utterances,
-        "speaker_segments": speaker_segments,
-        "conversation_formatted": conversation_formatted,
-        "agent_speaker": agent_speaker,
-        "other_speakers": other_speakers,
-        "agent_text": agent_text,
-        "other_text": other_text.strip()
-    }
-
-
 @router.post(
     "/upload",
     summary="음성 파일 업로드 → 전사 → 분석 (통합 API)",
@@ -322,48 +599,46 @@ async def analyze_audio_file(
     - 5분 음성 기준 약 30~60초 소요
     """
     # 파일 확장자 검증
-    allowed_extensions = {".mp3", ".wav", ".m4a"}
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_AUDIO_EXTENSIONS:
         raise HTTPException(
             status_code=400,
             detail="지원하지 않는 파일 형식입니다. (mp3, wav, m4a만 가능)"
         )
 
     # 파일 저장
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_dir = get_scratch_dir()
 
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     file_path = upload_dir / f"{file_id}{file_ext}"
 
     try:
-        content = await file.read()
-        with open(file_path, "wb") as f:
-            f.write(content)
+        # 청크 단위로 저장 (본문 전체를 메모리에 올리지 않음)
+        await save_upload_file(file, file_path)
 
         # 오디오 길이 확인 (최대 30분)
-        duration_ms = get_audio_duration_ms(str(file_path))
+        duration_ms = await run_in_threadpool(get_audio_duration_ms, str(file_path))
         max_duration_ms = 30 * 60 * 1000
         if duration_ms > max_duration_ms:
-            os.remove(file_path)
+            await remove_file(file_path)
             raise HTTPException(
                 status_code=400,
                 detail="음성 파일이 너무 깁니다. (최대 30분)"
             )
 
         # 1. 전사 (STT)
-        stt_service = AsyncSTTService()
-        transcript_result = await stt_service.transcribe_with_progress(
+        transcript_result = await async_stt_service.transcribe_with_progress(
             audio_file_path=str(file_path),
             language_code="ko"
         )
 
-        # 2. 분석 데이터 준비
-        data = _prepare_analysis_data_from_dict(
+        # 2. 분석 데이터 준비 (긴 통화는 전처리 비용이 커서 스레드풀에서 실행)
+        data = await run_in_threadpool(
+            analysis_service.prepare_analysis_data,
             utterances=transcript_result["utterances"],
             speakers=transcript_result["speakers"],
-            my_speaker=my_speaker
+            my_speaker=my_speaker,
+            utterances_by_speaker=transcript_result.get("utterances_by_speaker")
         )
 
         # 3. 종합 분석
@@ -378,10 +653,10 @@ async def analyze_audio_file(
         )
 
         # 파일 삭제
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
 
-        return {
+        # 응답 모델 없이 dict를 반환하면 jsonable_encoder가 전체(전사 포함)를 순회하므로 직접 직렬화
+        return ORJSONResponse({
             "transcript": {
                 "file_id": file_id,
                 "duration_ms": transcript_result["duration"],
@@ -389,12 +664,11 @@ async def analyze_audio_file(
                 "utterances": transcript_result["utterances"],
                 "speakers": transcript_result["speakers"]
             },
-            "analysis": analysis
-        }
+            "analysis": analysis.model_dump(mode="json")
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         raise HTTPException(status_code=500, detail=f"처리 중 오류 발생: {str(e)}")
@@ -3,21 +3,28 @@ GPT Actions용 통화 분석 API 엔드포인트
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
 import uuid
-import os
 import time
 from pathlib import Path
 import httpx
 
 from app.core.config import settings
+from app.core.exceptions import CallMateException
 from app.utils.audio import get_audio_duration_ms
-from app.services.stt_service_async import AsyncSTTService
+from app.utils.download import download_to_file
+from app.utils.upload import get_scratch_dir, remove_file
+from app.services.stt_service_async import async_stt_service
 from app.services.analysis_service import analysis_service
 
 router = APIRouter(prefix="/calls", tags=["calls"])
 
+# 허용 음성 확장자
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".webm", ".oga", ".opus"})
+
 
 class AnalyzeUrlRequest(BaseModel):
     audio_url: str
@@ -31,54 +38,6 @@ class AnalyzeSampleRequest(BaseModel):
     consultation_type: str = "sales"
 
 
-def _prepare_analysis_data(utterances: list, speakers: list, my_speaker: Optional[str] = None):
-    """전사 결과에서 분석 데이터 전처리"""
-    conversation_formatted = "\n".join(
-        f"{u['speaker']}: {u['text']}" for u in utterances
-    )
-
-    speaker_segments = []
-    for speaker in speakers:
-        speaker_utterances = [u for u in utterances if u["speaker"] == speaker]
-        full_text = " ".join(u["text"] for u in speaker_utterances)
-        speaker_segments.append({
-            "speaker": speaker,
-            "full_text": full_text,
-            "utterances": speaker_utterances
-        })
-
-    if my_speaker and my_speaker in speakers:
-        agent_speaker = my_speaker
-        other_speakers = [s for s in speakers if s != agent_speaker]
-    else:
-        customer_speaker = analysis_service._detect_customer_speaker(
-            speaker_segments, utterances
-        )
-        agent_speaker = [s for s in speakers if s != customer_speaker][0] if len(speakers) > 1 else speakers[0]
-        other_speakers = [s for s in speakers if s != agent_speaker]
-
-    other_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] in other_speakers:
-            other_text += seg["full_text"] + " "
-
-    agent_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] == agent_speaker:
-            agent_text = seg["full_text"]
-            break
-
-    return {
-        "utterances": utterances,
-        "speaker_segments": speaker_segments,
-        "conversation_formatted": conversation_formatted,
-        "agent_speaker": agent_speaker,
-        "other_speakers": other_speakers,
-        "agent_text": agent_text,
-        "other_text": other_text.strip()
-    }
-
-
 @router.post(
     "/analyze-url",
     summary="URL로 통화 분석",
@@ -91,7 +50,7 @@ async def analyze_call_from_url(request: AnalyzeUrlRequest):
     1. uploadAudioFile API로 파일 업로드 후 받은 file_url 사용
     2. 또는 공개 접근 가능한 음성 파일 URL 사용
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     audio_url = request.audio_url
     my_speaker = request.my_speaker
@@ -105,54 +64,48 @@ async def analyze_call_from_url(request: AnalyzeUrlRequest):
         filename = "audio.mp3"
 
     file_ext = Path(filename).suffix.lower()
-    allowed_extensions = {".mp3", ".wav", ".m4a", ".ogg", ".webm", ".oga", ".opus"}
-    if not file_ext or file_ext not in allowed_extensions:
+    if not file_ext or file_ext not in ALLOWED_AUDIO_EXTENSIONS:
         file_ext = ".mp3"
 
     # 파일 다운로드
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_dir = get_scratch_dir()
 
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     file_path = upload_dir / f"{file_id}{file_ext}"
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(audio_url)
-            response.raise_for_status()
-            file_content = response.content
-
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # 파일 다운로드 (청크 단위로 디스크에 기록, 업로드와 같은 크기 제한)
+        await download_to_file(audio_url, file_path, max_bytes=settings.MAX_UPLOAD_SIZE)
 
         # 오디오 길이 확인 (최대 30분)
-        duration_ms = get_audio_duration_ms(str(file_path))
+        duration_ms = await run_in_threadpool(get_audio_duration_ms, str(file_path))
         max_duration_ms = 30 * 60 * 1000
         if duration_ms > max_duration_ms:
-            os.remove(file_path)
+            await remove_file(file_path)
             raise HTTPException(
                 status_code=400,
                 detail={"code": "FILE_TOO_LONG", "message": "음성 파일이 너무 깁니다. (최대 30분)"}
             )
 
         # 1. 전사 (STT)
-        stt_start = time.time()
-        stt_service = AsyncSTTService()
-        transcript_result = await stt_service.transcribe_with_progress(
+        stt_start = time.perf_counter()
+        transcript_result = await async_stt_service.transcribe_with_progress(
             audio_file_path=str(file_path),
             language_code="ko"
         )
-        stt_time = time.time() - stt_start
+        stt_time = time.perf_counter() - stt_start
 
-        # 2. 분석 데이터 준비
-        data = _prepare_analysis_data(
+        # 2. 분석 데이터 준비 (긴 통화는 전처리 비용이 커서 스레드풀에서 실행)
+        data = await run_in_threadpool(
+            analysis_service.prepare_analysis_data,
             utterances=transcript_result["utterances"],
             speakers=transcript_result["speakers"],
-            my_speaker=my_speaker
+            my_speaker=my_speaker,
+            utterances_by_speaker=transcript_result.get("utterances_by_speaker")
         )
 
         # 3. 종합 분석
-        analysis_start = time.time()
+        analysis_start = time.perf_counter()
         analysis = await analysis_service.analyze_call(
             transcript_id=file_id,
             conversation_formatted=data["conversation_formatted"],
@@ -162,15 +115,15 @@ async def analyze_call_from_url(request: AnalyzeUrlRequest):
             other_speakers=data["other_speakers"],
             script_context=None
         )
-        analysis_time = time.time() - analysis_start
+        analysis_time = time.perf_counter() - analysis_start
 
         # 파일 삭제
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
 
-        return {
+        # 응답 모델 없이 dict를 반환하면 jsonable_encoder가 전체(전사 포함)를 순회하므로 직접 직렬화
+        return ORJSONResponse({
             "transcript": {
                 "file_id": file_id,
                 "duration_ms": transcript_result["duration"],
@@ -178,24 +131,25 @@ async def analyze_call_from_url(request: AnalyzeUrlRequest):
                 "utterances": transcript_result["utterances"],
                 "speakers": transcript_result["speakers"]
             },
-            "analysis": analysis,
+            "analysis": analysis.model_dump(mode="json"),
             "processing_time": {
                 "stt_seconds": round(stt_time, 2),
                 "analysis_seconds": round(analysis_time, 2),
                 "total_seconds": round(total_time, 2)
             }
-        }
+        })
 
     except httpx.HTTPError as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         raise HTTPException(
             status_code=400,
             detail={"code": "DOWNLOAD_ERROR", "message": f"URL에서 파일을 다운로드할 수 없습니다: {str(e)}"}
         )
+    except CallMateException as e:
+        await remove_file(file_path)
+        raise e.to_http_exception()
     except Exception as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         raise HTTPException(
             status_code=500,
             detail={"code": "PROCESSING_ERROR", "message": f"처리 중 오류 발생: {str(e)}"}
@@ -12,13 +12,23 @@ File upload API endpoints
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
+import os
 
 from app.services.s3_service import s3_service
 from app.core.config import settings
+from app.utils.upload import get_upload_size, is_pdf_filename
 
 router = APIRouter(prefix="/files", tags=["files (향후 확장용)"])
 
+# 음성 확장자 → Content-Type (허용 확장자 목록을 겸함)
+AUDIO_CONTENT_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4"
+}
+
 
 @router.post(
     "/upload/audio",
@@ -43,11 +53,10 @@ async def upload_audio(
     - `storage`: 저장소 타입 (s3 / local)
     """
     # 확장자 검증
-    allowed_extensions = {".mp3", ".wav", ".m4a"}
     filename = file.filename or "audio.mp3"
-    ext = filename.lower().split(".")[-1] if "." in filename else ""
+    ext = os.path.splitext(filename)[1].lower()
 
-    if f".{ext}" not in allowed_extensions:
+    if ext not in AUDIO_CONTENT_TYPES:
         raise HTTPException(
             status_code=400,
             detail={
@@ -56,11 +65,9 @@ async def upload_audio(
             }
         )
 
-    # 파일 읽기
-    content = await file.read()
-
-    # 크기 검증 (50MB)
-    if len(content) > settings.MAX_UPLOAD_SIZE:
+    # 크기 검증 (50MB) - 본문을 메모리로 읽지 않고 확인
+    size_bytes = get_upload_size(file)
+    if size_bytes > settings.MAX_UPLOAD_SIZE:
         raise HTTPException(
             status_code=400,
             detail={
@@ -69,28 +76,23 @@ async def upload_audio(
             }
         )
 
-    # Content-Type 매핑
-    content_types = {
-        "mp3": "audio/mpeg",
-        "wav": "audio/wav",
-        "m4a": "audio/mp4"
-    }
-
-    # 업로드
-    file_key, file_url = await s3_service.upload_file(
-        file_content=content,
+    # 업로드 (파일 객체를 청크 단위로 전송)
+    await file.seek(0)
+    file_key, file_url = await s3_service.upload_fileobj(
+        fileobj=file.file,
         filename=filename,
         folder="audio",
-        content_type=content_types.get(ext, "audio/mpeg")
+        content_type=AUDIO_CONTENT_TYPES[ext]
     )
 
-    return {
+    # jsonable_encoder를 거치지 않고 바로 직렬화
+    return ORJSONResponse({
         "file_key": file_key,
         "file_url": file_url,
         "storage": "s3" if settings.use_s3 else "local",
         "filename": filename,
-        "size_bytes": len(content)
-    }
+        "size_bytes": size_bytes
+    })
 
 
 @router.post(
@@ -117,7 +119,7 @@ async def upload_pdf(
     """
     # 확장자 검증
     filename = file.filename or "document.pdf"
-    if not filename.lower().endswith(".pdf"):
+    if not is_pdf_filename(filename):
         raise HTTPException(
             status_code=400,
             detail={
@@ -126,12 +128,10 @@ async def upload_pdf(
             }
         )
 
-    # 파일 읽기
-    content = await file.read()
-
-    # 크기 검증 (10MB)
+    # 크기 검증 (10MB) - 본문을 메모리로 읽지 않고 확인
     max_pdf_size = 10 * 1024 * 1024
-    if len(content) > max_pdf_size:
+    size_bytes = get_upload_size(file)
+    if size_bytes > max_pdf_size:
         raise HTTPException(
             status_code=400,
             detail={
@@ -140,21 +140,23 @@ async def upload_pdf(
             }
         )
 
-    # 업로드
-    file_key, file_url = await s3_service.upload_file(
-        file_content=content,
+    # 업로드 (파일 객체를 청크 단위로 전송)
+    await file.seek(0)
+    file_key, file_url = await s3_service.upload_fileobj(
+        fileobj=file.file,
         filename=filename,
         folder="pdf",
         content_type="application/pdf"
     )
 
-    return {
+    # jsonable_encoder를 거치지 않고 바로 직렬화
+    return ORJSONResponse({
         "file_key": file_key,
         "file_url": file_url,
         "storage": "s3" if settings.use_s3 else "local",
         "filename": filename,
-        "size_bytes": len(content)
-    }
+        "size_bytes": size_bytes
+    })
 
 
 @router.delete(
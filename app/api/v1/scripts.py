@@ -4,9 +4,10 @@ Supports form input (4-step wizard) and PDF file inputs.
 """
 
 from fastapi import APIRouter, UploadFile, File, Form
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from typing import Optional
 import tempfile
-import os
 
 from app.schemas.script import (
     FormScriptRequest,
@@ -20,6 +21,8 @@ from app.schemas.script import (
     ProblemSolution
 )
 from app.services.script_extractor_service import script_extractor_service
+from app.core.process_pool import run_in_process
+from app.utils.upload import get_upload_size, is_pdf_filename, remove_file, save_upload_file
 from app.core.exceptions import (
     InvalidFileTypeError,
     FileSizeExceededError,
@@ -29,6 +32,32 @@ from app.core.exceptions import (
 
 router = APIRouter(prefix="/scripts", tags=["scripts"])
 
+# 응답 직렬화기 (JSON bytes를 바로 생성 → str 변환/인코딩 없음)
+SCRIPT_RESPONSE_ADAPTER = TypeAdapter(ScriptExtractionResponse)
+
+# 이 크기 이하의 PDF는 임시 파일 없이 메모리에서 파싱 (워커 프로세스로 바이트 전달)
+IN_MEMORY_PDF_MAX_SIZE = 5 * 1024 * 1024
+
+# 폼 추출 메타데이터 total_items에 합산하는 항목
+TOTAL_ITEMS_KEYS = (
+    "key_features",
+    "faq",
+    "pricing_info",
+    "objection_responses",
+    "common_problems",
+    "key_phrases"
+)
+
+
+def _model_response(model: ScriptExtractionResponse) -> Response:
+    """
+    이미 검증된 응답 모델을 한 번만 직렬화해서 반환
+
+    모델을 그대로 반환하면 FastAPI가 response_model로 dump → 재검증 → 직렬화를
+    다시 수행하므로 직접 JSON으로 내보냅니다. (response_model은 문서용으로 유지)
+    """
+    return Response(content=SCRIPT_RESPONSE_ADAPTER.dump_json(model), media_type="application/json")
+
 
 @router.post(
     "/extract/form",
@@ -62,17 +91,17 @@ async def extract_from_form(request: FormScriptRequest):
         request.company_name
     )
 
-    # ExtractedScript 객체 생성
-    extracted = ExtractedScript(
+    # ExtractedScript 객체 생성 (검증된 요청 모델에서 나온 값 → 재검증 생략)
+    extracted = ExtractedScript.model_construct(
         company_name=extracted_data["company_name"],
         consultation_type=ConsultationType(extracted_data["consultation_type"]) if extracted_data.get("consultation_type") else None,
         product_name=extracted_data.get("product_name", ""),
         key_features=extracted_data.get("key_features", []),
-        faq=[QAPair(**qa) for qa in extracted_data.get("faq", [])],
+        faq=[QAPair.model_construct(**qa) for qa in extracted_data.get("faq", [])],
         pricing_info=extracted_data.get("pricing_info", []),
         competitive_advantages=extracted_data.get("competitive_advantages", []),
-        objection_responses=[ObjectionResponse(**obj) for obj in extracted_data.get("objection_responses", [])],
-        common_problems=[ProblemSolution(**ps) for ps in extracted_data.get("common_problems", [])],
+        objection_responses=[ObjectionResponse.model_construct(**obj) for obj in extracted_data.get("objection_responses", [])],
+        common_problems=[ProblemSolution.model_construct(**ps) for ps in extracted_data.get("common_problems", [])],
         compensation_options=extracted_data.get("compensation_options", []),
         escalation_criteria=extracted_data.get("escalation_criteria", []),
         tone_style=ToneStyle(extracted_data["tone_style"]) if extracted_data.get("tone_style") else None,
@@ -82,16 +111,9 @@ async def extract_from_form(request: FormScriptRequest):
     )
 
     # 메타데이터 계산
-    total_items = (
-        len(extracted_data.get("key_features", [])) +
-        len(extracted_data.get("faq", [])) +
-        len(extracted_data.get("pricing_info", [])) +
-        len(extracted_data.get("objection_responses", [])) +
-        len(extracted_data.get("common_problems", [])) +
-        len(extracted_data.get("key_phrases", []))
-    )
+    total_items = sum(len(extracted_data.get(key, ())) for key in TOTAL_ITEMS_KEYS)
 
-    return ScriptExtractionResponse(
+    return _model_response(ScriptExtractionResponse.model_construct(
         success=True,
         input_type=ScriptInputType.FORM,
         extracted=extracted,
@@ -101,7 +123,7 @@ async def extract_from_form(request: FormScriptRequest):
             "total_items": total_items,
             "has_tone_settings": request.tone_settings is not None
         }
-    )
+    ))
 
 
 @router.post(
@@ -132,49 +154,54 @@ async def extract_from_pdf(
     - `metadata.page_count`: PDF 페이지 수
     """
     # 파일 확장자 검사
-    if not file.filename.lower().endswith('.pdf'):
+    if not is_pdf_filename(file.filename):
         raise InvalidFileTypeError("pdf").to_http_exception()
 
     # MIME 타입 검증 (추가 보안)
     if file.content_type != "application/pdf":
         raise InvalidFileTypeError("pdf").to_http_exception()
 
-    # 파일 크기 검사 (10MB)
-    contents = await file.read()
-    if len(contents) > 10 * 1024 * 1024:
+    # 파일 크기 검사 (10MB) - 본문을 메모리로 읽지 않고 확인
+    file_size = get_upload_size(file)
+    if file_size > 10 * 1024 * 1024:
         raise FileSizeExceededError(max_size_mb=10).to_http_exception()
 
     try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(contents)
-            tmp_path = tmp.name
+        tmp_path = None
 
         try:
-            # PDF에서 추출
-            extracted_data = script_extractor_service.extract_from_pdf(tmp_path)
-
-            # 회사명 오버라이드
-            if company_name:
-                extracted_data["company_name"] = company_name
-
-            # 프롬프트 컨텍스트 생성
-            prompt_context = script_extractor_service.generate_prompt_context(
-                extracted_data,
+            if file_size <= IN_MEMORY_PDF_MAX_SIZE:
+                # 작은 PDF: 임시 파일 없이 바이트 그대로 파싱
+                await file.seek(0)
+                source = await file.read()
+            else:
+                # 큰 PDF: 임시 파일로 저장 (청크 단위 복사)
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
+                    tmp_path = tmp.name
+                await save_upload_file(file, tmp_path)
+                source = tmp_path
+
+            # PDF에서 추출 (CPU 바운드 → 프로세스 풀에서 실행, 회사명은 추출 시 반영)
+            extracted_data = await run_in_process(
+                script_extractor_service.extract_from_pdf,
+                source,
                 company_name
             )
 
-            # ExtractedScript 객체 생성
-            extracted = ExtractedScript(
+            # 프롬프트 컨텍스트 생성
+            prompt_context = script_extractor_service.generate_prompt_context(extracted_data)
+
+            # ExtractedScript 객체 생성 (추출 서비스가 타입/키를 보장 → 재검증/타입 필터 생략)
+            extracted = ExtractedScript.model_construct(
                 company_name=extracted_data.get("company_name", ""),
                 consultation_type=ConsultationType(extracted_data["consultation_type"]) if extracted_data.get("consultation_type") else None,
                 product_name=extracted_data.get("product_name", ""),
                 key_features=extracted_data.get("key_features", []),
-                faq=[QAPair(**qa) for qa in extracted_data.get("faq", []) if isinstance(qa, dict)],
+                faq=[QAPair.model_construct(**qa) for qa in extracted_data["faq"]],
                 pricing_info=extracted_data.get("pricing_info", []),
                 competitive_advantages=extracted_data.get("competitive_advantages", []),
-                objection_responses=[ObjectionResponse(**obj) for obj in extracted_data.get("objection_responses", []) if isinstance(obj, dict)],
-                common_problems=[ProblemSolution(**ps) for ps in extracted_data.get("common_problems", []) if isinstance(ps, dict)],
+                objection_responses=[ObjectionResponse.model_construct(**obj) for obj in extracted_data["objection_responses"]],
+                common_problems=[ProblemSolution.model_construct(**ps) for ps in extracted_data["common_problems"]],
                 compensation_options=extracted_data.get("compensation_options", []),
                 escalation_criteria=extracted_data.get("escalation_criteria", []),
                 tone_style=ToneStyle(extracted_data["tone_style"]) if extracted_data.get("tone_style") else None,
@@ -183,7 +210,7 @@ async def extract_from_pdf(
                 key_phrases=extracted_data.get("key_phrases", [])
             )
 
-            return ScriptExtractionResponse(
+            return _model_response(ScriptExtractionResponse.model_construct(
                 success=True,
                 input_type=ScriptInputType.PDF,
                 extracted=extracted,
@@ -193,12 +220,12 @@ async def extract_from_pdf(
                     "page_count": extracted_data.get("page_count", 0),
                     "char_count": len(extracted_data.get("raw_text", ""))
                 }
-            )
+            ))
 
         finally:
             # 임시 파일 삭제
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            if tmp_path:
+                await remove_file(tmp_path)
 
     except Exception as e:
         raise PDFParsingError(str(e)).to_http_exception()
@@ -1,23 +1,29 @@
 """WebSocket endpoint for real-time transcription with progress updates"""
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
-import asyncio
-import json
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+import orjson
+import time
 import uuid
-import os
 import aiofiles
 from pathlib import Path
 from typing import Optional
-import base64
 
 from app.core.config import settings
 from app.core.rate_limiter import rate_limiter
 from app.utils.audio import get_audio_duration_ms
-from app.services.stt_service_async import AsyncSTTService
+from app.utils.upload import base64_decoded_size, get_scratch_dir, remove_file, save_base64_file
+from app.services.stt_service_async import async_stt_service
 
 router = APIRouter()
 
+# 허용 음성 확장자
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a"})
+
+# 진행률이 바뀌지 않은 업데이트의 최소 전송 간격 (초)
+PROGRESS_MIN_INTERVAL = 0.2
+
 
 # ============================================
 # WebSocket 문서화용 엔드포인트 (Swagger 표시용)
@@ -39,16 +45,24 @@ ws://host/api/v1/transcripts/ws/transcribe
 ### 프로토콜
 
 **1. 클라이언트 → 서버 (파일 업로드)**
+
+메타데이터(JSON) 전송 후, 파일 내용을 **바이너리 프레임**으로 `size` 바이트만큼 전송합니다.
+서버의 WebSocket 메시지 크기 제한(uvicorn 기본 16MB)을 넘지 않도록 **1MB 단위로 나눠** 보내세요.
+(파일 전체를 한 번에 `ws.send(file)`하면 16MB를 넘는 파일은 서버가 연결을 끊습니다 - 1009)
 ```json
 {
     "action": "upload",
     "filename": "call.mp3",
-    "data": "<base64 인코딩된 파일>",
+    "size": 1048576,  // 파일 크기 (바이트)
     "language_code": "ko",
     "keywords": ["인터케어:5", "스카우터:3"]  // 선택: 회사명/제품명 인식률 향상
 }
 ```
 
+기존 방식(JSON 안에 base64)도 지원합니다. (`size` 대신 `"data": "<base64 인코딩된 파일>"`)
+base64는 전송량이 1.33배이고 서버 디코딩 비용이 있으며, JSON 메시지 하나로 전송되므로
+메시지 크기 제한 때문에 약 12MB(원본 기준)까지만 가능합니다 → 바이너리 프레임을 권장합니다.
+
 **2. 서버 → 클라이언트 (진행률)**
 ```json
 {"status": "received", "data": {"file_id": "uuid", "duration_ms": 180000}}
@@ -66,18 +80,21 @@ ws://host/api/v1/transcripts/ws/transcribe
 ```javascript
 const ws = new WebSocket('ws://localhost:8000/api/v1/transcripts/ws/transcribe');
 
-// 파일을 base64로 인코딩하여 전송
-const reader = new FileReader();
-reader.onload = () => {
-    const base64 = reader.result.split(',')[1];
+// 메타데이터 → 파일 바이너리 순서로 전송
+const CHUNK_SIZE = 1 << 20;  // 1MB (서버 메시지 크기 제한 16MB 미만)
+
+ws.onopen = () => {
     ws.send(JSON.stringify({
         action: 'upload',
         filename: file.name,
-        data: base64,
+        size: file.size,
         language_code: 'ko'
     }));
+    // File/Blob 조각은 각각 바이너리 프레임으로 전송됨
+    for (let offset = 0; offset < file.size; offset += CHUNK_SIZE) {
+        ws.send(file.slice(offset, offset + CHUNK_SIZE));
+    }
 };
-reader.readAsDataURL(file);
 
 // 메시지 수신
 ws.onmessage = (event) => {
@@ -92,6 +109,8 @@ ws.onmessage = (event) => {
 
 ### 제한사항
 - 최대 파일 길이: 30분
+- 최대 파일 크기: 50MB (1MB 단위 바이너리 프레임 전송 시, 프레임 하나는 16MB 미만)
+- base64(JSON) 전송 시: 약 12MB (JSON 메시지 하나가 16MB 미만이어야 함)
 - 지원 형식: mp3, wav, m4a
 - 일일 사용량: IP당 30분
 
@@ -122,7 +141,7 @@ ws.onmessage = (event) => {
                             "send": {
                                 "action": "upload",
                                 "filename": "call.mp3",
-                                "data": "<base64>",
+                                "size": 1048576,
                                 "language_code": "ko"
                             },
                             "receive": [
@@ -139,7 +158,7 @@ ws.onmessage = (event) => {
 )
 async def websocket_transcribe_docs():
     """WebSocket 전사 API 문서 (실제 연결은 WebSocket 사용)"""
-    return JSONResponse({
+    return ORJSONResponse({
         "message": "이 엔드포인트는 WebSocket 전용입니다. HTTP GET은 지원하지 않습니다.",
         "websocket_url": "ws://{host}/api/v1/transcripts/ws/transcribe",
         "documentation": "/api/docs#/transcripts-ws"
@@ -150,18 +169,24 @@ class TranscriptionWebSocket:
 
     def __init__(self, websocket: WebSocket):
         self.websocket = websocket
-        self.stt_service = AsyncSTTService()
+        self.stt_service = async_stt_service
+        self._last_progress_at = 0.0
+        self._last_percent = -1
+
+    async def _send(self, message: dict):
+        """Send message as a JSON text frame (orjson - the completed message carries the whole transcript)"""
+        await self.websocket.send_text(orjson.dumps(message).decode())
 
     async def send_status(self, status: str, data: dict = None):
         """Send status message to client"""
         message = {"status": status}
         if data:
             message["data"] = data
-        await self.websocket.send_json(message)
+        await self._send(message)
 
     async def send_error(self, code: str, message: str):
         """Send error message to client"""
-        await self.websocket.send_json({
+        await self._send({
             "status": "error",
             "error": {
                 "code": code,
@@ -170,8 +195,18 @@ class TranscriptionWebSocket:
         })
 
     async def send_progress(self, percent: int, message: str):
-        """Send progress update to client"""
-        await self.websocket.send_json({
+        """Send progress update to client (같은 진행률의 연속 업데이트는 PROGRESS_MIN_INTERVAL마다 한 번만)"""
+        now = time.monotonic()
+        if (
+            percent == self._last_percent
+            and percent not in (0, 100)
+            and now - self._last_progress_at < PROGRESS_MIN_INTERVAL
+        ):
+            return
+        self._last_progress_at = now
+        self._last_percent = percent
+
+        await self._send({
             "status": "processing",
             "progress": {
                 "percent": percent,
@@ -180,6 +215,31 @@ class TranscriptionWebSocket:
         })
 
 
+async def _receive_binary_file(websocket: WebSocket, file_path: Path, size: int) -> None:
+    """
+    바이너리 프레임으로 전송되는 파일을 size 바이트까지 받아 저장
+
+    Raises:
+        WebSocketDisconnect: 전송 중 연결 종료
+        ValueError: 텍스트 프레임 수신 또는 size 초과
+    """
+    received = 0
+    async with aiofiles.open(file_path, "wb") as f:
+        while received < size:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            chunk = message.get("bytes")
+            if chunk is None:
+                raise ValueError("바이너리 프레임이 아닙니다.")
+
+            received += len(chunk)
+            if received > size:
+                raise ValueError("선언한 크기보다 큰 데이터입니다.")
+            await f.write(chunk)
+
+
 @router.websocket("/ws/transcribe")
 async def websocket_transcribe(websocket: WebSocket):
     """
@@ -187,7 +247,9 @@ async def websocket_transcribe(websocket: WebSocket):
 
     ## Protocol:
     1. Client connects to ws://host/api/v1/transcripts/ws/transcribe
-    2. Client sends: {"action": "upload", "filename": "test.mp3", "data": "<base64>", "language_code": "ko"}
+    2. Client sends: {"action": "upload", "filename": "test.mp3", "size": 1048576, "language_code": "ko"}
+       followed by the file content as binary frames (size bytes in total)
+       (legacy: {"action": "upload", "filename": "test.mp3", "data": "<base64>", "language_code": "ko"})
     3. Server sends progress updates:
        - {"status": "received", "data": {"file_id": "...", "duration_ms": 180000}}
        - {"status": "processing", "progress": {"percent": 10, "message": "파일 읽는 중..."}}
@@ -202,13 +264,18 @@ async def websocket_transcribe(websocket: WebSocket):
     const ws = new WebSocket('ws://localhost:8000/api/v1/transcripts/ws/transcribe');
 
     ws.onopen = () => {
-        const fileData = btoa(audioFileContent); // base64 encode
         ws.send(JSON.stringify({
             action: 'upload',
-            filename: 'call.mp3',
-            data: fileData,
+            filename: file.name,
+            size: file.size,
             language_code: 'ko'
         }));
+        // raw bytes in 1MB binary frames (each message must stay under
+        // the server's WebSocket max message size, 16MB by default)
+        const CHUNK_SIZE = 1 << 20;
+        for (let offset = 0; offset < file.size; offset += CHUNK_SIZE) {
+            ws.send(file.slice(offset, offset + CHUNK_SIZE));
+        }
     };
 
     ws.onmessage = (event) => {
@@ -237,19 +304,38 @@ async def websocket_transcribe(websocket: WebSocket):
 
         # Extract file info
         filename = data.get("filename", "audio.mp3")
-        file_data_b64 = data.get("data")
+        file_data_b64 = data.get("data")  # 기존 방식 (base64)
+        file_size = data.get("size")  # 바이너리 프레임 방식
         language_code = data.get("language_code", "ko")
         keywords = data.get("keywords", [])  # 회사명, 제품명 등 (프론트에서 전달)
 
-        if not file_data_b64:
+        # size는 양의 정수만 허용 (bool은 int 하위 타입이므로 제외)
+        has_size = isinstance(file_size, int) and not isinstance(file_size, bool) and file_size > 0
+        if not file_data_b64 and not has_size:
             await handler.send_error("MISSING_DATA", "파일 데이터가 없습니다.")
             await websocket.close()
             return
 
+        # base64 데이터는 문자열이어야 함 (크기 계산/디코딩 전에 확인)
+        if file_data_b64 and not isinstance(file_data_b64, str):
+            await handler.send_error("INVALID_DATA", "잘못된 파일 데이터입니다.")
+            await websocket.close()
+            return
+
+        # 크기 검사 (base64는 디코딩 전에 문자열 길이로 계산)
+        if file_data_b64:
+            file_size = base64_decoded_size(file_data_b64)
+        if file_size > settings.MAX_UPLOAD_SIZE:
+            await handler.send_error(
+                "FILE_TOO_LARGE",
+                f"파일이 너무 큽니다. (최대 {settings.MAX_UPLOAD_SIZE // 1024 // 1024}MB)"
+            )
+            await websocket.close()
+            return
+
         # Validate file extension
-        allowed_extensions = {".mp3", ".wav", ".m4a"}
         file_ext = Path(filename).suffix.lower()
-        if file_ext not in allowed_extensions:
+        if file_ext not in ALLOWED_AUDIO_EXTENSIONS:
             await handler.send_error(
                 "INVALID_FILE_TYPE",
                 "지원하지 않는 음성 파일 형식입니다. (mp3, wav, m4a만 가능)"
@@ -257,33 +343,37 @@ async def websocket_transcribe(websocket: WebSocket):
             await websocket.close()
             return
 
-        # Decode base64
-        try:
-            file_content = base64.b64decode(file_data_b64)
-        except Exception:
-            await handler.send_error("INVALID_DATA", "잘못된 파일 데이터입니다.")
-            await websocket.close()
-            return
-
         await handler.send_progress(5, "파일 저장 중...")
 
         # Save file
-        upload_dir = Path(settings.UPLOAD_DIR)
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        upload_dir = get_scratch_dir()
 
-        file_id = str(uuid.uuid4())
+        file_id = uuid.uuid4().hex
         file_path = upload_dir / f"{file_id}{file_ext}"
 
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(file_content)
+        try:
+            if file_data_b64:
+                # base64를 청크 단위로 디코딩하며 저장 → 디코딩 결과 전체를 메모리에 두지 않음
+                await save_base64_file(file_data_b64, file_path)
+            else:
+                # 바이너리 프레임을 받는 대로 저장
+                await _receive_binary_file(websocket, file_path, file_size)
+        except WebSocketDisconnect:
+            await remove_file(file_path)
+            raise
+        except Exception:
+            await remove_file(file_path)
+            await handler.send_error("INVALID_DATA", "잘못된 파일 데이터입니다.")
+            await websocket.close()
+            return
 
         # Check audio duration
         try:
-            duration_ms = get_audio_duration_ms(str(file_path))
+            duration_ms = await run_in_threadpool(get_audio_duration_ms, str(file_path))
             max_duration_ms = 30 * 60 * 1000  # 30분
 
             if duration_ms > max_duration_ms:
-                os.remove(file_path)
+                await remove_file(file_path)
                 await handler.send_error(
                     "AUDIO_DURATION_EXCEEDED",
                     "음성 파일이 너무 깁니다. (최대 30분)"
@@ -295,8 +385,7 @@ async def websocket_transcribe(websocket: WebSocket):
             # For now, we'll skip it or implement differently
 
         except Exception as e:
-            if file_path.exists():
-                os.remove(file_path)
+            await remove_file(file_path)
             await handler.send_error("AUDIO_ANALYSIS_ERROR", f"음성 파일 분석 실패: {e}")
             await websocket.close()
             return
@@ -314,9 +403,7 @@ async def websocket_transcribe(websocket: WebSocket):
             result = await handler.stt_service.transcribe_with_progress(
                 audio_file_path=str(file_path),
                 language_code=language_code,
-                progress_callback=lambda p, m: asyncio.create_task(
-                    handler.send_progress(p, m)
-                ),
+                progress_callback=handler.send_progress,  # STT 서비스가 순서대로 await
                 keywords=keywords  # 회사명, 제품명 등 인식률 향상
             )
 
@@ -331,10 +418,12 @@ async def websocket_transcribe(websocket: WebSocket):
             })
 
         except Exception as e:
-            if file_path.exists():
-                os.remove(file_path)
             await handler.send_error("STT_PROCESSING_ERROR", f"음성 변환 중 오류가 발생했습니다. ({e})")
 
+        finally:
+            # 전사가 끝나면 임시 파일 삭제 (결과는 프론트엔드에서 저장)
+            await remove_file(file_path)
+
     except WebSocketDisconnect:
         pass
     except Exception as e:
@@ -0,0 +1,131 @@
+"""
+분석 결과 캐시 (워커 간 공유)
+
+- REDIS_URL 설정 시: Redis에 저장 → 여러 uvicorn 워커가 같은 결과를 재사용
+- 미설정 시: 프로세스 내 TTLCache (로컬 개발용)
+
+값은 직렬화된 JSON bytes로 저장합니다.
+Redis 장애 시에는 캐시 미스로 처리하여 요청 자체는 실패하지 않습니다.
+
+acquire_lock/release_lock: 같은 키를 여러 워커가 동시에 계산하지 않도록 하는 분산 락
+(Redis 미사용 시에는 단일 프로세스이므로 항상 획득 성공)
+락 값은 획득할 때마다 새로 만든 토큰이며, 해제 시 토큰이 같을 때만 삭제합니다.
+(TTL 만료 후 다른 워커가 다시 획득한 락을 이전 보유자가 지우지 않도록)
+"""
+
+from typing import Optional
+import uuid
+
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 키 네임스페이스 (캐시 포맷 변경 시 버전 올림)
+KEY_PREFIX = "callmate:v1:"
+LOCK_PREFIX = "callmate:lock:"
+
+# 로컬 캐시 최대 항목 수 (Redis 미사용 시)
+LOCAL_MAX_SIZE = 1024
+
+# 토큰이 일치할 때만 락 삭제 (조회와 삭제를 원자적으로)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+
+class ResultCache:
+    """Redis 또는 로컬 메모리 기반 결과 캐시"""
+
+    def __init__(self, redis_url: Optional[str] = None, default_ttl: int = 3600):
+        self.default_ttl = default_ttl
+        self._redis = None
+        self._release_lock_script = None
+        self._local: Optional[TTLCache] = None
+
+        if redis_url:
+            from redis.asyncio import Redis
+            self._redis = Redis.from_url(redis_url)
+            self._release_lock_script = self._redis.register_script(RELEASE_LOCK_SCRIPT)
+        else:
+            self._local = TTLCache(maxsize=LOCAL_MAX_SIZE, ttl=default_ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (없으면 None)"""
+        if self._redis is None:
+            return self._local.get(key)
+
+        try:
+            return await self._redis.get(KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 | key={key} | {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """캐시 저장"""
+        if self._redis is None:
+            self._local[key] = value
+            return
+
+        try:
+            await self._redis.set(KEY_PREFIX + key, value, ex=ttl or self.default_ttl)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 | key={key} | {e}")
+
+    async def delete(self, key: str) -> None:
+        """캐시 삭제"""
+        if self._redis is None:
+            self._local.pop(key, None)
+            return
+
+        try:
+            await self._redis.delete(KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"캐시 삭제 실패 | key={key} | {e}")
+
+    async def acquire_lock(self, key: str, ttl: int) -> Optional[str]:
+        """
+        분산 락 획득 (ttl초 후 자동 해제)
+
+        Returns:
+            락 토큰 (release_lock에 전달), 이미 다른 워커가 보유 중이면 None
+        """
+        token = uuid.uuid4().hex
+        if self._redis is None:
+            return token
+
+        try:
+            if await self._redis.set(LOCK_PREFIX + key, token, nx=True, ex=ttl):
+                return token
+            return None
+        except Exception as e:
+            # Redis 장애 시 락 없이 진행 (요청 자체는 실패하지 않음)
+            logger.warning(f"락 획득 실패 | key={key} | {e}")
+            return token
+
+    async def release_lock(self, key: str, token: str) -> None:
+        """분산 락 해제 (토큰이 일치할 때만 - 만료 후 다른 워커가 획득한 락은 유지)"""
+        if self._redis is None:
+            return
+
+        try:
+            await self._release_lock_script(keys=[LOCK_PREFIX + key], args=[token])
+        except Exception as e:
+            logger.warning(f"락 해제 실패 | key={key} | {e}")
+
+    async def close(self) -> None:
+        """Redis 연결 종료 (앱 종료 시)"""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# 전역 인스턴스
+result_cache = ResultCache(
+    redis_url=settings.REDIS_URL,
+    default_ttl=settings.CACHE_TTL_SECONDS
+)
@@ -0,0 +1,48 @@
+"""
+응답 압축 (gzip)
+
+스크립트 추출/분석 응답은 한글 위주 JSON이라 수십 KB가 흔하고 gzip으로 3~5배 줄어듭니다.
+
+Starlette GZipMiddleware는 스트리밍 응답을 압축 버퍼에 쌓아 두므로,
+SSE(text/event-stream)는 이벤트가 늦게 도착합니다 → SSE는 압축하지 않고 그대로 전달합니다.
+(분석 스트리밍 API, MCP Streamable HTTP)
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# 이보다 작은 응답은 압축 이득보다 CPU 비용이 큼
+GZIP_MINIMUM_SIZE = 1024
+
+# 압축률/CPU 절충 (기본 9는 5 대비 크기 이득이 거의 없고 느림)
+GZIP_COMPRESSLEVEL = 5
+
+# 압축하지 않을 스트리밍 Content-Type
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+
+class _StreamingAwareGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(UNCOMPRESSED_MEDIA_TYPES):
+                # 이미 인코딩된 응답과 같은 경로(그대로 전달)로 처리
+                self.content_encoding_set = True
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """SSE 응답을 제외하고 gzip 압축하는 미들웨어"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = _StreamingAwareGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
 from typing import List, Optional
 
@@ -6,6 +7,9 @@ from typing import List, Optional
 class Settings(BaseSettings):
     """Application settings (MVP)"""
 
+    # 설정값은 시작 시 한 번 읽고 변경하지 않음 → 파생 값(use_s3 등)도 첫 접근 시 한 번만 계산
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
     # Application
     APP_NAME: str = "CallMate API"
     APP_VERSION: str = "1.0.0"
@@ -34,8 +38,22 @@ class Settings(BaseSettings):
     # File Upload
     MAX_UPLOAD_SIZE: int = 52428800  # 50MB
     UPLOAD_DIR: str = "./uploads"  # S3 미설정 시 로컬 저장
+    SCRATCH_DIR: Optional[str] = None  # 분석 후 바로 삭제하는 임시 음성 파일 위치 (예: /dev/shm/callmate, 미설정 시 UPLOAD_DIR)
+    SCRATCH_FILE_MAX_AGE_MINUTES: int = 60  # 이보다 오래 남은 임시 파일은 주기적으로 삭제 (0이면 비활성화)
+
+    # Concurrency (워커당)
+    OPENAI_MAX_CONCURRENCY: int = 16  # 동시 LLM 호출 수
+    THREADPOOL_SIZE: int = 64  # run_in_threadpool 스레드 수 (파일 I/O, 전처리)
+    PROCESS_POOL_SIZE: int = 2  # PDF 파싱 등 CPU 작업용 프로세스 수 (0이면 스레드풀 사용)
+
+    # API Routers (콤마 구분, 목록에 없는 라우터 모듈은 import하지 않음)
+    ENABLED_ROUTERS: str = "transcripts,transcripts_ws,analysis,scripts,files,calls"
+
+    # Cache (미설정 시 프로세스 내 메모리 캐시)
+    REDIS_URL: Optional[str] = None
+    CACHE_TTL_SECONDS: int = 3600
 
-    @property
+    @cached_property
     def use_s3(self) -> bool:
         """S3 사용 여부 (AWS 설정이 모두 있으면 True)"""
         return all([
@@ -44,14 +62,20 @@ class Settings(BaseSettings):
             self.S3_BUCKET_NAME
         ])
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
         """Parse CORS origins from comma-separated string"""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
+    @cached_property
+    def scratch_dir(self) -> str:
+        """Directory for transient audio files (falls back to UPLOAD_DIR)"""
+        return self.SCRATCH_DIR or self.UPLOAD_DIR
+
+    @cached_property
+    def enabled_routers(self) -> List[str]:
+        """Parse enabled API router modules from comma-separated string"""
+        return [name.strip() for name in self.ENABLED_ROUTERS.split(",") if name.strip()]
+
 
 settings = Settings()
@@ -106,6 +106,29 @@ class CallMateException(Exception):
         )
 
 
+class DetailMessageError(CallMateException):
+    """
+    기본 메시지 + 선택적 상세 내용 예외
+
+    하위 클래스는 클래스 속성(메시지/코드/상태 코드)만 정의합니다.
+    detail이 있으면 "기본 메시지 (detail)" 형식으로 표시합니다.
+    """
+
+    default_message: str = ErrorMessage.SERVER_ERROR
+    error_code: str = ErrorCode.SERVER_ERROR
+    error_status_code: int = 500
+
+    def __init__(self, detail: Optional[str] = None):
+        message = self.default_message
+        if detail:
+            message = f"{message} ({detail})"
+        super().__init__(
+            message=message,
+            code=self.error_code,
+            status_code=self.error_status_code
+        )
+
+
 # 파일 관련 예외
 class InvalidFileTypeError(CallMateException):
     """지원하지 않는 파일 형식"""
@@ -136,18 +159,12 @@ class FileSizeExceededError(CallMateException):
         )
 
 
-class FileSaveError(CallMateException):
+class FileSaveError(DetailMessageError):
     """파일 저장 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.FILE_SAVE_FAILED
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.FILE_SAVE_FAILED,
-            status_code=500
-        )
+    default_message = ErrorMessage.FILE_SAVE_FAILED
+    error_code = ErrorCode.FILE_SAVE_FAILED
+    error_status_code = 500
 
 
 # 전사 관련 예외
@@ -165,61 +182,37 @@ class TranscriptNotFoundError(CallMateException):
         )
 
 
-class STTProcessingError(CallMateException):
+class STTProcessingError(DetailMessageError):
     """STT 처리 오류"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.STT_PROCESSING_ERROR
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.STT_PROCESSING_ERROR,
-            status_code=500
-        )
+    default_message = ErrorMessage.STT_PROCESSING_ERROR
+    error_code = ErrorCode.STT_PROCESSING_ERROR
+    error_status_code = 500
 
 
 # 분석 관련 예외
-class AnalysisError(CallMateException):
+class AnalysisError(DetailMessageError):
     """분석 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.ANALYSIS_FAILED
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.ANALYSIS_FAILED,
-            status_code=500
-        )
+    default_message = ErrorMessage.ANALYSIS_FAILED
+    error_code = ErrorCode.ANALYSIS_FAILED
+    error_status_code = 500
 
 
-class SummaryError(CallMateException):
+class SummaryError(DetailMessageError):
     """요약 생성 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.SUMMARY_FAILED
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.SUMMARY_FAILED,
-            status_code=500
-        )
+    default_message = ErrorMessage.SUMMARY_FAILED
+    error_code = ErrorCode.SUMMARY_FAILED
+    error_status_code = 500
 
 
-class FeedbackError(CallMateException):
+class FeedbackError(DetailMessageError):
     """피드백 생성 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.FEEDBACK_FAILED
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.FEEDBACK_FAILED,
-            status_code=500
-        )
+    default_message = ErrorMessage.FEEDBACK_FAILED
+    error_code = ErrorCode.FEEDBACK_FAILED
+    error_status_code = 500
 
 
 class InvalidConsultationTypeError(CallMateException):
@@ -234,32 +227,20 @@ class InvalidConsultationTypeError(CallMateException):
 
 
 # 스크립트 관련 예외
-class PDFParsingError(CallMateException):
+class PDFParsingError(DetailMessageError):
     """PDF 파싱 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.PDF_PARSING_ERROR
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.PDF_PARSING_ERROR,
-            status_code=400
-        )
+    default_message = ErrorMessage.PDF_PARSING_ERROR
+    error_code = ErrorCode.PDF_PARSING_ERROR
+    error_status_code = 400
 
 
-class ScriptExtractionError(CallMateException):
+class ScriptExtractionError(DetailMessageError):
     """스크립트 추출 실패"""
 
-    def __init__(self, detail: Optional[str] = None):
-        message = ErrorMessage.SCRIPT_EXTRACTION_ERROR
-        if detail:
-            message = f"{message} ({detail})"
-        super().__init__(
-            message=message,
-            code=ErrorCode.SCRIPT_EXTRACTION_ERROR,
-            status_code=500
-        )
+    default_message = ErrorMessage.SCRIPT_EXTRACTION_ERROR
+    error_code = ErrorCode.SCRIPT_EXTRACTION_ERROR
+    error_status_code = 500
 
 
 # 사용량 제한 예외
@@ -0,0 +1,81 @@
+"""
+CPU 바운드 작업용 프로세스 풀
+
+PDF 파싱(pdfplumber)처럼 GIL을 오래 점유하는 작업은 스레드풀에서 실행해도
+같은 워커의 다른 요청 처리를 지연시키므로 별도 프로세스에서 실행합니다.
+
+- 앱 lifespan에서 start/warm/shutdown
+- 워커는 시작 시 PRELOAD_MODULES를 import (첫 요청에서 pdfplumber 등 import 비용을 내지 않도록)
+- 풀이 없으면(테스트, 스크립트 실행 등) 스레드풀로 대체
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from typing import Any, Callable, Optional, Tuple
+import asyncio
+import multiprocessing
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+# 워커 프로세스 시작 시 미리 import할 모듈 (풀에서 실행되는 함수의 모듈)
+PRELOAD_MODULES: Tuple[str, ...] = ("app.services.script_extractor_service",)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _preload(modules: Tuple[str, ...]) -> None:
+    """워커 초기화: 무거운 모듈을 미리 import"""
+    for name in modules:
+        import_module(name)
+
+
+def _noop() -> None:
+    """워커 기동용 빈 작업"""
+
+
+def start_process_pool() -> None:
+    """프로세스 풀 생성 (spawn: 이벤트 루프/스레드 상태를 fork로 복제하지 않음)"""
+    global _pool
+    if _pool is None and settings.PROCESS_POOL_SIZE > 0:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.PROCESS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preload,
+            initargs=(PRELOAD_MODULES,)
+        )
+
+
+async def warm_process_pool() -> None:
+    """
+    워커 프로세스를 미리 기동
+
+    ProcessPoolExecutor는 작업이 들어올 때 워커를 띄우므로, 풀 크기만큼 빈 작업을 보내
+    인터프리터 기동 + PRELOAD_MODULES import를 요청 전에 끝내둡니다.
+    """
+    if _pool is None:
+        return
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(_pool, _noop) for _ in range(settings.PROCESS_POOL_SIZE)
+    ))
+
+
+def shutdown_process_pool() -> None:
+    """프로세스 풀 종료"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    함수를 프로세스 풀에서 실행
+
+    func와 인자, 반환값은 pickle 가능해야 합니다. (모듈 최상위 함수 또는 전역 인스턴스의 메서드)
+    """
+    if _pool is None:
+        return await run_in_threadpool(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(_pool, func, *args)
@@ -1,9 +1,17 @@
 """Prompt management system for LLM interactions"""
 
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Optional
 import re
+from cachetools import LRUCache
+
+# 템플릿 변수 {{name}} (한 번만 컴파일, 렌더링 시 템플릿을 한 번만 순회)
+VARIABLE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# 캐시할 프롬프트 템플릿 수 (prompts/ 전체보다 넉넉하게, 상한으로 메모리 제한)
+PROMPT_CACHE_SIZE = 64
 
 
 class PromptManager:
@@ -11,7 +19,7 @@ class PromptManager:
 
     def __init__(self, prompts_dir: str = "prompts"):
         self.prompts_dir = Path(prompts_dir)
-        self._cache: Dict[str, str] = {}
+        self._cache: LRUCache = LRUCache(maxsize=PROMPT_CACHE_SIZE)
 
     def load_prompt(self, prompt_path: str, use_cache: bool = True) -> str:
         """
@@ -39,7 +47,8 @@ class PromptManager:
             raise FileNotFoundError(f"Prompt file not found: {full_path}")
 
         with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
+            # intern: 다른 경로로 읽은 같은 내용의 템플릿은 한 객체를 공유
+            content = sys.intern(f.read())
 
         # Cache it
         if use_cache:
@@ -70,13 +79,16 @@ class PromptManager:
         if not variables:
             return template
 
-        # Replace {{variable}} with actual values
-        rendered = template
-        for key, value in variables.items():
-            pattern = r"\{\{" + re.escape(key) + r"\}\}"
-            rendered = re.sub(pattern, str(value), rendered)
+        # Replace {{variable}} with actual values (한 번의 순회로 모든 변수 치환, 없는 변수는 그대로 유지)
+        def replace(match: re.Match) -> str:
+            key = match.group(1)
+            return str(variables[key]) if key in variables else match.group(0)
+
+        return VARIABLE_PATTERN.sub(replace, template)
 
-        return rendered
+    def cache_info(self) -> Dict[str, int]:
+        """Cached prompt count and capacity"""
+        return {"size": len(self._cache), "maxsize": self._cache.maxsize}
 
     def clear_cache(self):
         """Clear all cached prompts"""
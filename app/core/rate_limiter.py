@@ -7,6 +7,7 @@ IP 기반 일일 사용량 제한
 
 from datetime import datetime, timezone, timedelta
 from typing import Dict
+import time
 from fastapi import Request
 
 from app.core.exceptions import RateLimitExceededError
@@ -19,8 +20,11 @@ class IPRateLimiter:
     """IP별 일일 사용량 제한 (한국 시간 기준)"""
 
     def __init__(self):
-        # {ip: {"date": "2024-01-15", "total_duration_ms": 1200000}}
-        self.usage: Dict[str, dict] = {}
+        # {ip: 오늘 사용한 시간(ms)}
+        # 오늘(KST) 기록만 보관 - 날짜가 바뀌면 전체 초기화 (날짜는 IP별이 아닌 전체에 한 번만 저장)
+        self.usage: Dict[str, int] = {}
+        # 다음 초기화 시각 (다음 KST 자정, Unix timestamp)
+        self._reset_at = self._get_next_kst_midnight()
 
         # 제한 설정
         self.MAX_DURATION_PER_DAY_MS = 30 * 60 * 1000  # 하루 총 30분 (ms)
@@ -30,21 +34,24 @@ class IPRateLimiter:
         # 프록시/로드밸런서 뒤에 있을 경우
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            return forwarded.split(",")[0].strip()
+            # 첫 번째 값(원래 클라이언트)만 필요 - split처럼 전체 목록을 만들지 않음
+            return forwarded.partition(",")[0].strip()
         return request.client.host
 
-    def _get_kst_date(self) -> str:
-        """한국 시간 기준 오늘 날짜 반환"""
-        return datetime.now(KST).date().isoformat()
+    def _get_next_kst_midnight(self) -> float:
+        """다음 한국 시간 자정의 Unix timestamp"""
+        tomorrow = datetime.now(KST).date() + timedelta(days=1)
+        return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=KST).timestamp()
 
-    def _reset_if_new_day(self, ip: str):
+    def _reset_if_new_day(self):
         """날짜가 바뀌면 초기화 (한국 시간 기준)"""
-        today_kst = self._get_kst_date()
-        if ip not in self.usage or self.usage[ip]["date"] != today_kst:
-            self.usage[ip] = {
-                "date": today_kst,
-                "total_duration_ms": 0
-            }
+        # 요청마다 날짜를 계산하지 않고 다음 자정 시각과 비교만 함
+        if time.time() < self._reset_at:
+            return
+
+        # 전날 기록은 모두 무효 → 한 번에 삭제 (다시 접속하지 않는 IP가 계속 쌓이지 않도록)
+        self.usage.clear()
+        self._reset_at = self._get_next_kst_midnight()
 
     def check_limit(self, request: Request, duration_ms: int = 0):
         """
@@ -55,10 +62,9 @@ class IPRateLimiter:
             duration_ms: 추가할 음성 파일 길이 (밀리초)
         """
         ip = self._get_client_ip(request)
-        self._reset_if_new_day(ip)
+        self._reset_if_new_day()
 
-        usage = self.usage[ip]
-        remaining_ms = self.MAX_DURATION_PER_DAY_MS - usage["total_duration_ms"]
+        remaining_ms = self.MAX_DURATION_PER_DAY_MS - self.usage.get(ip, 0)
 
         # 남은 시간보다 큰 파일 업로드 시도
         if duration_ms > remaining_ms:
@@ -68,21 +74,21 @@ class IPRateLimiter:
     def record_usage(self, request: Request, duration_ms: int):
         """사용량 기록"""
         ip = self._get_client_ip(request)
-        self._reset_if_new_day(ip)
+        self._reset_if_new_day()
 
-        self.usage[ip]["total_duration_ms"] += duration_ms
+        self.usage[ip] = self.usage.get(ip, 0) + duration_ms
 
     def get_remaining(self, request: Request) -> dict:
         """남은 사용량 조회"""
         ip = self._get_client_ip(request)
-        self._reset_if_new_day(ip)
+        self._reset_if_new_day()
 
-        usage = self.usage[ip]
-        remaining_ms = self.MAX_DURATION_PER_DAY_MS - usage["total_duration_ms"]
+        used_ms = self.usage.get(ip, 0)
+        remaining_ms = self.MAX_DURATION_PER_DAY_MS - used_ms
 
         return {
-            "used_duration_ms": usage["total_duration_ms"],
-            "used_duration_min": usage["total_duration_ms"] // 60000,
+            "used_duration_ms": used_ms,
+            "used_duration_min": used_ms // 60000,
             "remaining_duration_ms": max(0, remaining_ms),
             "remaining_duration_min": max(0, remaining_ms // 60000),
             "max_duration_min": self.MAX_DURATION_PER_DAY_MS // 60000
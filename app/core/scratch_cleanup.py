@@ -0,0 +1,94 @@
+"""
+임시 음성 파일(SCRATCH_DIR) 주기적 정리
+
+각 핸들러는 처리 후 임시 파일을 삭제하지만, 워커가 처리 중 종료(재시작, OOM 등)되면
+파일이 남습니다. 일정 시간이 지난 임시 파일을 주기적으로 삭제합니다.
+
+- 앱 lifespan에서 start/stop
+- SCRATCH_DIR 최상위의 "<uuid>.<확장자>" 파일만 대상 (로컬 저장소의 audio/, pdf/ 폴더는 건드리지 않음)
+- SCRATCH_FILE_MAX_AGE_MINUTES가 0이면 비활성화
+"""
+
+from pathlib import Path
+from typing import Optional
+import asyncio
+import time
+import uuid
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 정리 주기 (초)
+SCRATCH_CLEANUP_INTERVAL = 15 * 60
+
+_task: Optional[asyncio.Task] = None
+
+
+def _is_scratch_file(path: Path) -> bool:
+    """핸들러가 만든 임시 파일인지 (uuid4 파일명)"""
+    try:
+        uuid.UUID(path.stem)
+    except ValueError:
+        return False
+    return path.is_file()
+
+
+def sweep_scratch_dir(directory: str, max_age_seconds: float) -> int:
+    """
+    max_age_seconds보다 오래된 임시 파일 삭제 (동기)
+
+    Returns:
+        삭제한 파일 수
+    """
+    root = Path(directory)
+    if not root.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for path in root.iterdir():
+        if not _is_scratch_file(path):
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            # 핸들러(또는 다른 워커)가 먼저 삭제
+            continue
+    return removed
+
+
+async def _cleanup_loop() -> None:
+    max_age_seconds = settings.SCRATCH_FILE_MAX_AGE_MINUTES * 60
+    while True:
+        try:
+            removed = await run_in_threadpool(sweep_scratch_dir, settings.scratch_dir, max_age_seconds)
+            if removed:
+                logger.info(f"오래된 임시 파일 삭제 | dir={settings.scratch_dir} | count={removed}")
+        except Exception as e:
+            logger.warning(f"임시 파일 정리 실패 | dir={settings.scratch_dir} | {e}")
+        await asyncio.sleep(SCRATCH_CLEANUP_INTERVAL)
+
+
+def start_scratch_cleanup() -> None:
+    """정리 태스크 시작"""
+    global _task
+    if _task is None and settings.SCRATCH_FILE_MAX_AGE_MINUTES > 0:
+        _task = asyncio.create_task(_cleanup_loop())
+
+
+async def stop_scratch_cleanup() -> None:
+    """정리 태스크 종료"""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
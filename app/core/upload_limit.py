@@ -0,0 +1,43 @@
+"""
+요청 본문 크기 제한 (ASGI 미들웨어)
+
+FastAPI는 핸들러 호출 전에 multipart 본문 전체를 받아 임시 파일로 저장하므로,
+핸들러에서 크기를 검사하면 이미 전송/저장 비용을 치른 뒤입니다.
+Content-Length가 한도를 넘는 요청은 본문을 읽기 전에 413으로 거절합니다.
+
+- Content-Length 없는 요청(chunked)은 통과 → 각 핸들러의 크기 검사가 처리
+- 엔드포인트별 더 작은 한도(PDF 10MB 등)도 핸들러에서 검사
+"""
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.exceptions import FileSizeExceededError
+
+# multipart 경계/헤더 등 파일 외 본문 여유분
+MULTIPART_OVERHEAD = 1024 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Content-Length가 max_body_size를 넘는 HTTP 요청을 본문 수신 전에 거절"""
+
+    def __init__(self, app: ASGIApp, max_body_size: int):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.max_content_length = max_body_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_content_length:
+                        error = FileSizeExceededError(self.max_body_size // 1024 // 1024)
+                        response = ORJSONResponse(
+                            status_code=413,
+                            content={"detail": {"code": error.code, "message": error.message}}
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -1,8 +1,17 @@
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.core.cache import result_cache
+from app.core.upload_limit import UploadSizeLimitMiddleware
+from app.core.compression import StreamingAwareGZipMiddleware, GZIP_MINIMUM_SIZE, GZIP_COMPRESSLEVEL
+from app.core.process_pool import start_process_pool, warm_process_pool, shutdown_process_pool
+from app.core.scratch_cleanup import start_scratch_cleanup, stop_scratch_cleanup
+from app.utils.download import close_http_client
 from app.mcp_server import mcp, mcp_app
 
 
@@ -10,8 +19,17 @@ from app.mcp_server import mcp, mcp_app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage MCP server lifespan along with FastAPI"""
+    # run_in_threadpool 스레드 수 (기본 40)
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    start_process_pool()
+    await warm_process_pool()
+    start_scratch_cleanup()
     async with mcp.session_manager.run():
         yield
+    await stop_scratch_cleanup()
+    shutdown_process_pool()
+    await close_http_client()
+    await result_cache.close()
 
 # API Documentation metadata
 description = """
@@ -61,13 +79,17 @@ description = """
 const ws = new WebSocket('ws://localhost:8000/api/v1/transcripts/ws/transcribe');
 
 ws.onopen = () => {
-    const fileData = btoa(audioFileContent); // base64 인코딩
+    // 메타데이터(JSON) → 파일 내용(1MB 단위 바이너리 프레임)
+    // 서버 WebSocket 메시지 크기 제한(16MB) 때문에 파일 전체를 한 번에 보내지 않음
     ws.send(JSON.stringify({
         action: 'upload',
-        filename: 'call.mp3',
-        data: fileData,
+        filename: file.name,
+        size: file.size,
         language_code: 'ko'
     }));
+    for (let offset = 0; offset < file.size; offset += 1 << 20) {
+        ws.send(file.slice(offset, offset + (1 << 20)));
+    }
 };
 
 ws.onmessage = (event) => {
@@ -133,8 +155,19 @@ app = FastAPI(
         "name": "MIT",
     },
     lifespan=lifespan,  # MCP lifespan 관리
+    default_response_class=ORJSONResponse,  # stdlib json 대신 orjson으로 응답 직렬화
 )
 
+# 응답 gzip 압축 (SSE 제외, 가장 안쪽에서 앱 응답만 압축)
+app.add_middleware(
+    StreamingAwareGZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESSLEVEL
+)
+
+# 업로드 크기 제한 (본문 수신 전 Content-Length로 거절, CORS 헤더가 붙도록 CORS보다 먼저 등록)
+app.add_middleware(UploadSizeLimitMiddleware, max_body_size=settings.MAX_UPLOAD_SIZE)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -142,26 +175,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # 분석 API 재검증(If-None-Match)용
 )
 
 
+# 설정값만 담긴 고정 응답 → 시작 시 한 번만 직렬화 (헬스체크는 로드밸런서가 수 초마다 호출)
+ROOT_BODY = orjson.dumps({
+    "message": "Welcome to CallMate API",
+    "version": settings.APP_VERSION,
+    "docs": "/api/docs"
+})
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "environment": settings.ENVIRONMENT
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to CallMate API",
-        "version": settings.APP_VERSION,
-        "docs": "/api/docs"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "environment": settings.ENVIRONMENT
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # Include API routes
@@ -178,5 +217,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools"
     )
@@ -1,21 +1,28 @@
 """MCP Server for Kakao PlayMCP integration using official MCP SDK FastMCP"""
 
-import os
 import uuid
 import base64
 import json
+import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 import httpx
 
+from fastapi.concurrency import run_in_threadpool
 from mcp.server.fastmcp import FastMCP
 
 from app.core.config import settings
 from app.utils.audio import get_audio_duration_ms
-from app.services.stt_service_async import AsyncSTTService
+from app.utils.download import download_to_file
+from app.utils.upload import get_scratch_dir, remove_file
+from app.services.stt_service_async import async_stt_service
 from app.services.analysis_service import analysis_service
 from app.services.s3_service import s3_service
 
+# 허용 음성 확장자 (URL 다운로드)
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".webm", ".oga", ".opus"})
+
 
 # Create MCP server instance using official SDK's FastMCP
 mcp = FastMCP(
@@ -44,57 +51,8 @@ mcp = FastMCP(
 )
 
 
-def _prepare_analysis_data_from_dict(utterances: list, speakers: list, my_speaker: Optional[str] = None):
-    """전사 결과 dict에서 분석 데이터 전처리"""
-    conversation_formatted = "\n".join(
-        f"{u['speaker']}: {u['text']}" for u in utterances
-    )
-
-    speaker_segments = []
-    for speaker in speakers:
-        speaker_utterances = [u for u in utterances if u["speaker"] == speaker]
-        full_text = " ".join(u["text"] for u in speaker_utterances)
-        speaker_segments.append({
-            "speaker": speaker,
-            "full_text": full_text,
-            "utterances": speaker_utterances
-        })
-
-    if my_speaker and my_speaker in speakers:
-        agent_speaker = my_speaker
-        other_speakers = [s for s in speakers if s != agent_speaker]
-    else:
-        customer_speaker = analysis_service._detect_customer_speaker(
-            speaker_segments, utterances
-        )
-        agent_speaker = [s for s in speakers if s != customer_speaker][0] if len(speakers) > 1 else speakers[0]
-        other_speakers = [s for s in speakers if s != agent_speaker]
-
-    other_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] in other_speakers:
-            other_text += seg["full_text"] + " "
-
-    agent_text = ""
-    for seg in speaker_segments:
-        if seg["speaker"] == agent_speaker:
-            agent_text = seg["full_text"]
-            break
-
-    return {
-        "utterances": utterances,
-        "speaker_segments": speaker_segments,
-        "conversation_formatted": conversation_formatted,
-        "agent_speaker": agent_speaker,
-        "other_speakers": other_speakers,
-        "agent_text": agent_text,
-        "other_text": other_text.strip()
-    }
-
-
 def _convert_to_wav(input_path: str, output_path: str) -> bool:
     """ffmpeg를 사용해 오디오를 WAV로 변환"""
-    import subprocess
     try:
         result = subprocess.run(
             ['ffmpeg', '-y', '-i', input_path, '-ar', '16000', '-ac', '1', output_path],
@@ -165,8 +123,7 @@ async def analyze_call_from_url(
     quick_mode: bool = False
 ) -> dict:
     """URL에서 음성 파일을 다운로드하여 분석합니다."""
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # URL에서 파일명 추출
     try:
@@ -177,53 +134,46 @@ async def analyze_call_from_url(
         filename = "audio.mp3"
 
     file_ext = Path(filename).suffix.lower()
-    allowed_extensions = {".mp3", ".wav", ".m4a", ".ogg", ".webm", ".oga", ".opus"}
-    if not file_ext or file_ext not in allowed_extensions:
+    if not file_ext or file_ext not in ALLOWED_AUDIO_EXTENSIONS:
         # 확장자 없으면 mp3로 가정
         file_ext = ".mp3"
 
     # 파일 다운로드
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_dir = get_scratch_dir()
 
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     file_path = upload_dir / f"{file_id}{file_ext}"
 
     try:
-        # httpx로 파일 다운로드
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(audio_url)
-            response.raise_for_status()
-            file_content = response.content
-
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # 파일 다운로드 (청크 단위로 디스크에 기록, 업로드와 같은 크기 제한)
+        await download_to_file(audio_url, file_path, max_bytes=settings.MAX_UPLOAD_SIZE)
 
         # 오디오 길이 확인 (최대 30분)
-        duration_ms = get_audio_duration_ms(str(file_path))
+        duration_ms = await run_in_threadpool(get_audio_duration_ms, str(file_path))
         max_duration_ms = 30 * 60 * 1000
         if duration_ms > max_duration_ms:
-            os.remove(file_path)
+            await remove_file(file_path)
             return {"error": "음성 파일이 너무 깁니다. (최대 30분)"}
 
         # 1. 전사 (STT)
-        stt_start = time.time()
-        stt_service = AsyncSTTService()
-        transcript_result = await stt_service.transcribe_with_progress(
+        stt_start = time.perf_counter()
+        transcript_result = await async_stt_service.transcribe_with_progress(
             audio_file_path=str(file_path),
             language_code="ko"
         )
-        stt_time = time.time() - stt_start
+        stt_time = time.perf_counter() - stt_start
 
-        # 2. 분석 데이터 준비
-        data = _prepare_analysis_data_from_dict(
+        # 2. 분석 데이터 준비 (긴 통화는 전처리 비용이 커서 스레드풀에서 실행)
+        data = await run_in_threadpool(
+            analysis_service.prepare_analysis_data,
             utterances=transcript_result["utterances"],
             speakers=transcript_result["speakers"],
-            my_speaker=my_speaker
+            my_speaker=my_speaker,
+            utterances_by_speaker=transcript_result.get("utterances_by_speaker")
         )
 
         # 3. 종합 분석
-        analysis_start = time.time()
+        analysis_start = time.perf_counter()
         analysis = await analysis_service.analyze_call(
             transcript_id=file_id,
             conversation_formatted=data["conversation_formatted"],
@@ -233,13 +183,12 @@ async def analyze_call_from_url(
             other_speakers=data["other_speakers"],
             script_context=None
         )
-        analysis_time = time.time() - analysis_start
+        analysis_time = time.perf_counter() - analysis_start
 
         # 파일 삭제
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
 
         return {
             "transcript": {
@@ -258,12 +207,10 @@ async def analyze_call_from_url(
         }
 
     except httpx.HTTPError as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         return {"error": f"URL에서 파일을 다운로드할 수 없습니다: {str(e)}"}
     except Exception as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         return {"error": f"처리 중 오류 발생: {str(e)}"}
 
 
@@ -325,8 +272,7 @@ async def transcribe_call(
     audio_url: str
 ) -> dict:
     """음성 파일을 텍스트로만 변환합니다 (분석 없음)."""
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # URL에서 파일명 추출
     try:
@@ -337,38 +283,29 @@ async def transcribe_call(
         filename = "audio.mp3"
 
     file_ext = Path(filename).suffix.lower()
-    allowed_extensions = {".mp3", ".wav", ".m4a", ".ogg", ".webm", ".oga", ".opus"}
-    if not file_ext or file_ext not in allowed_extensions:
+    if not file_ext or file_ext not in ALLOWED_AUDIO_EXTENSIONS:
         file_ext = ".mp3"
 
     # 파일 다운로드
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_dir = get_scratch_dir()
 
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     file_path = upload_dir / f"{file_id}{file_ext}"
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(audio_url)
-            response.raise_for_status()
-            file_content = response.content
-
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # 파일 다운로드 (청크 단위로 디스크에 기록, 업로드와 같은 크기 제한)
+        await download_to_file(audio_url, file_path, max_bytes=settings.MAX_UPLOAD_SIZE)
 
         # 전사 (STT)만 실행
-        stt_service = AsyncSTTService()
-        transcript_result = await stt_service.transcribe_with_progress(
+        transcript_result = await async_stt_service.transcribe_with_progress(
             audio_file_path=str(file_path),
             language_code="ko"
         )
 
         # 파일 삭제
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
 
         return {
             "file_id": file_id,
@@ -380,12 +317,10 @@ async def transcribe_call(
         }
 
     except httpx.HTTPError as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         return {"error": f"URL에서 파일을 다운로드할 수 없습니다: {str(e)}"}
     except Exception as e:
-        if file_path.exists():
-            os.remove(file_path)
+        await remove_file(file_path)
         return {"error": f"처리 중 오류 발생: {str(e)}"}
 
 
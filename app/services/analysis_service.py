@@ -1,7 +1,9 @@
 """Call analysis service for MVP"""
 
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
+import asyncio
 import json
+from collections import defaultdict
 from datetime import datetime
 from openai import AsyncOpenAI
 
@@ -79,6 +81,8 @@ class AnalysisService:
     def __init__(self):
         self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY.get_secret_value())
         self.model = "gpt-4o-mini"  # MVP: 비용 효율적인 모델 사용
+        # 동시 LLM 호출 수 제한 (워커당, 레이트 리밋 초과·대기열 폭증 방지)
+        self._llm_slots = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
 
     async def analyze_call(
         self,
@@ -113,25 +117,26 @@ class AnalysisService:
         speakers = list(speaker_texts.keys())
 
         # 상담사/상대방 결정 (이미 API에서 전달받음, fallback만 처리)
-        if not agent_speaker or not other_speakers:
+        # 화자가 1명이면 other_speakers가 빈 리스트이므로 None일 때만 다시 감지
+        if not agent_speaker or other_speakers is None:
             customer_speaker = self._detect_customer_speaker(speaker_segments, utterances)
             agent_speaker = [s for s in speakers if s != customer_speaker][0] if len(speakers) > 1 else speakers[0]
             other_speakers = [s for s in speakers if s != agent_speaker]
 
         # 상대방 텍스트 (여러 명일 수 있음)
-        other_text = " ".join(speaker_texts.get(s, "") for s in other_speakers)
+        other_text = " ".join([speaker_texts.get(s, "") for s in other_speakers])
         agent_text = speaker_texts.get(agent_speaker, "")
 
-        # 역할 라벨이 붙은 대화 포맷
-        conversation_with_roles = "\n".join([
-            f"{'상담사(나)' if u['speaker'] == agent_speaker else '상대방'}: {u['text']}"
-            for u in utterances
-        ])
-
-        utterances_text = "\n".join([
-            f"[{'상담사(나)' if u['speaker'] == agent_speaker else '상대방'}] {u['text']}"
-            for u in utterances
-        ])
+        # 역할 라벨이 붙은 대화 포맷 (두 포맷을 한 번의 순회로 생성)
+        conversation_lines = []
+        utterance_lines = []
+        for u in utterances:
+            role = "상담사(나)" if u["speaker"] == agent_speaker else "상대방"
+            text = u["text"]
+            conversation_lines.append(f"{role}: {text}")
+            utterance_lines.append(f"[{role}] {text}")
+        conversation_with_roles = "\n".join(conversation_lines)
+        utterances_text = "\n".join(utterance_lines)
 
         # 프롬프트 변수 준비
         variables = {
@@ -154,15 +159,16 @@ class AnalysisService:
         system_prompt = get_prompt("common/system.md")
 
         # OpenAI API 호출 (비동기)
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=3000
-        )
+        async with self._llm_slots:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=3000
+            )
 
         # JSON 응답 파싱
         content = response.choices[0].message.content
@@ -290,6 +296,91 @@ class AnalysisService:
         customer_speaker = max(scores.items(), key=lambda x: x[1])[0]
         return customer_speaker
 
+    def prepare_analysis_data(
+        self,
+        utterances: List[Dict],
+        speakers: List[str],
+        my_speaker: Optional[str] = None,
+        utterances_by_speaker: Optional[Dict[str, List[Dict]]] = None,
+        need_segments: bool = True
+    ) -> Dict:
+        """
+        전사 결과(utterance dict 목록)에서 분석 데이터 전처리
+
+        한 번의 순회로 대화 포맷과 화자별 발화를 만들고 (화자 수만큼 반복 스캔하지 않음)
+        상담사(나) / 상대방을 결정합니다.
+
+        Args:
+            utterances: 전사 결과 utterances
+            speakers: 화자 목록
+            my_speaker: 사용자가 지정한 상담사 화자 (없으면 휴리스틱으로 감지)
+            utterances_by_speaker: STT 결과의 화자별 발화 인덱스 (있으면 재그룹핑 생략)
+            need_segments: False면 speaker_segments를 만들지 않음 (None 반환)
+                           요약/피드백은 대화 포맷과 상대방 텍스트만 사용
+
+        Returns:
+            analyze_call 입력 데이터 (conversation_formatted, speaker_segments 등)
+        """
+        parts = []
+        if utterances_by_speaker is None:
+            by_speaker = defaultdict(list)
+            for u in utterances:
+                speaker = u["speaker"]
+                parts.extend((speaker, ": ", u["text"], "\n"))
+                by_speaker[speaker].append(u)
+        else:
+            by_speaker = utterances_by_speaker
+            for u in utterances:
+                parts.extend((u["speaker"], ": ", u["text"], "\n"))
+        if parts:
+            parts.pop()  # 마지막 줄바꿈 제거
+        conversation_formatted = "".join(parts)
+
+        # 화자별 전체 텍스트 (한 번만 join → 세그먼트/상담사/상대방 텍스트에서 재사용)
+        full_texts = {
+            speaker: " ".join([u["text"] for u in by_speaker.get(speaker, ())])
+            for speaker in speakers
+        }
+
+        # 화자별 세그먼트
+        speaker_segments = [
+            {
+                "speaker": speaker,
+                "full_text": full_texts[speaker],
+                "utterances": by_speaker.get(speaker, [])
+            }
+            for speaker in speakers
+        ] if need_segments else None
+
+        # 상담사(나) / 상대방 결정
+        if my_speaker and my_speaker in speakers:
+            agent_speaker = my_speaker
+            other_speakers = [s for s in speakers if s != agent_speaker]
+        else:
+            # 휴리스틱 fallback - 감지에는 화자/전체 텍스트만 필요
+            customer_speaker = self._detect_customer_speaker(
+                speaker_segments or [
+                    {"speaker": speaker, "full_text": text} for speaker, text in full_texts.items()
+                ],
+                utterances
+            )
+            agent_speaker = [s for s in speakers if s != customer_speaker][0] if len(speakers) > 1 else speakers[0]
+            other_speakers = [s for s in speakers if s != agent_speaker]
+
+        # 상담사 / 상대방(들) 텍스트
+        agent_text = full_texts.get(agent_speaker, "")
+        other_text = " ".join([full_texts[s] for s in other_speakers])
+
+        return {
+            "utterances": utterances,
+            "speaker_segments": speaker_segments,
+            "conversation_formatted": conversation_formatted,
+            "agent_speaker": agent_speaker,
+            "other_speakers": other_speakers,
+            "agent_text": agent_text,
+            "other_text": other_text.strip()
+        }
+
     async def generate_summary(
         self,
         transcript_id: str,
@@ -307,7 +398,36 @@ class AnalysisService:
         Returns:
             AISummaryResponse 객체
         """
-        # 프롬프트 준비
+        # OpenAI API 호출 (비동기)
+        async with self._llm_slots:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._summary_messages(conversation_formatted, customer_text),
+                temperature=0.3,
+                max_tokens=500
+            )
+
+        return self.parse_summary(transcript_id, response.choices[0].message.content)
+
+    async def stream_summary(
+        self,
+        conversation_formatted: str,
+        customer_text: str
+    ) -> AsyncIterator[str]:
+        """
+        AI 요약 스트리밍 (토큰 단위 텍스트 조각 반환)
+
+        전체 응답은 parse_summary()로 AISummaryResponse로 변환합니다.
+        """
+        async for delta in self._stream_completion(
+            messages=self._summary_messages(conversation_formatted, customer_text),
+            temperature=0.3,
+            max_tokens=500
+        ):
+            yield delta
+
+    def _summary_messages(self, conversation_formatted: str, customer_text: str) -> List[Dict]:
+        """요약 프롬프트 메시지 구성"""
         variables = {
             "conversation": conversation_formatted,
             "customer_text": customer_text
@@ -316,19 +436,13 @@ class AnalysisService:
         prompt = get_prompt("call_analysis/summary.md", variables)
         system_prompt = get_prompt("common/system.md")
 
-        # OpenAI API 호출 (비동기)
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=500
-        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
 
-        # JSON 파싱
-        content = response.choices[0].message.content
+    def parse_summary(self, transcript_id: str, content: str) -> AISummaryResponse:
+        """요약 LLM 응답(JSON)을 AISummaryResponse로 변환"""
         content = self._extract_json(content)
 
         try:
@@ -368,7 +482,50 @@ class AnalysisService:
         Returns:
             ResponseFeedbackResponse 객체
         """
-        # 프롬프트 준비
+        # OpenAI API 호출 (비동기)
+        async with self._llm_slots:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._feedback_messages(
+                    conversation_formatted, customer_text, consultation_type, script_context
+                ),
+                temperature=0.5,  # 피드백은 약간 더 창의적으로
+                max_tokens=1500
+            )
+
+        return self.parse_feedback(
+            transcript_id, response.choices[0].message.content, consultation_type
+        )
+
+    async def stream_feedback(
+        self,
+        conversation_formatted: str,
+        customer_text: str,
+        consultation_type: str,
+        script_context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        응대 피드백 스트리밍 (토큰 단위 텍스트 조각 반환)
+
+        전체 응답은 parse_feedback()으로 ResponseFeedbackResponse로 변환합니다.
+        """
+        async for delta in self._stream_completion(
+            messages=self._feedback_messages(
+                conversation_formatted, customer_text, consultation_type, script_context
+            ),
+            temperature=0.5,
+            max_tokens=1500
+        ):
+            yield delta
+
+    def _feedback_messages(
+        self,
+        conversation_formatted: str,
+        customer_text: str,
+        consultation_type: str,
+        script_context: Optional[str] = None
+    ) -> List[Dict]:
+        """피드백 프롬프트 메시지 구성"""
         variables = {
             "conversation": conversation_formatted,
             "customer_text": customer_text,
@@ -384,19 +541,18 @@ class AnalysisService:
 
         system_prompt = get_prompt("common/system.md")
 
-        # OpenAI API 호출 (비동기)
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.5,  # 피드백은 약간 더 창의적으로
-            max_tokens=1500
-        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
 
-        # JSON 파싱
-        content = response.choices[0].message.content
+    def parse_feedback(
+        self,
+        transcript_id: str,
+        content: str,
+        consultation_type: str
+    ) -> ResponseFeedbackResponse:
+        """피드백 LLM 응답(JSON)을 ResponseFeedbackResponse로 변환"""
         content = self._extract_json(content)
 
         try:
@@ -419,6 +575,29 @@ class AnalysisService:
             feedbacks=feedbacks
         )
 
+    async def _stream_completion(
+        self,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        """OpenAI 스트리밍 호출 - 응답 텍스트 조각(delta)을 순서대로 반환"""
+        # 스트림이 끝날 때까지 연결을 점유하므로 슬롯도 그동안 유지
+        async with self._llm_slots:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
     def _extract_json(self, content: str) -> str:
         """JSON 블록 추출"""
         if "```json" in content:
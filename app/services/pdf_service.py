@@ -1,33 +1,43 @@
 """PDF parsing service for extracting sales scripts"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+import io
 import pdfplumber
 import re
 
+# PDF 입력: 파일 경로 또는 PDF 바이트 (작은 파일은 임시 파일 없이 메모리에서 파싱)
+PDFSource = Union[str, bytes]
+
 
 class PDFService:
     """Service for parsing and extracting content from PDF scripts"""
 
-    def extract_text_from_pdf(self, file_path: str) -> str:
+    def extract_text_from_pdf(self, file_path: PDFSource) -> str:
         """
         Extract all text from PDF file
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file (or PDF bytes)
 
         Returns:
             Extracted text content
         """
+        return self._read_pdf(file_path)[0]
+
+    def _read_pdf(self, file_path: PDFSource) -> Tuple[str, int]:
+        """PDF를 한 번만 열어 전체 텍스트와 페이지 수를 함께 반환"""
+        source = io.BytesIO(file_path) if isinstance(file_path, bytes) else file_path
         text_content = []
 
-        with pdfplumber.open(file_path) as pdf:
+        with pdfplumber.open(source) as pdf:
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
                     text_content.append(text)
+            page_count = len(pdf.pages)
 
-        return "\n\n".join(text_content)
+        return "\n\n".join(text_content), page_count
 
     def extract_key_phrases(self, text: str) -> List[str]:
         """
@@ -97,12 +107,12 @@ class PDFService:
 
         return sections
 
-    def parse_script_pdf(self, file_path: str) -> Dict:
+    def parse_script_pdf(self, file_path: PDFSource) -> Dict:
         """
         Full parsing of script PDF
 
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file (or PDF bytes)
 
         Returns:
             Dictionary containing:
@@ -114,8 +124,8 @@ class PDFService:
                 "page_count": int
             }
         """
-        # Extract text
-        full_text = self.extract_text_from_pdf(file_path)
+        # Extract text + page count (PDF는 한 번만 열기)
+        full_text, page_count = self._read_pdf(file_path)
 
         # Extract key phrases
         key_phrases = self.extract_key_phrases(full_text)
@@ -123,10 +133,6 @@ class PDFService:
         # Extract sections
         sections = self.extract_sections(full_text)
 
-        # Get page count
-        with pdfplumber.open(file_path) as pdf:
-            page_count = len(pdf.pages)
-
         return {
             "full_text": full_text,
             "key_phrases": key_phrases,
@@ -1,14 +1,25 @@
 """S3 file storage service"""
 
 import os
+import shutil
 import uuid
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import BinaryIO, Optional, Tuple
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import settings
 
+# 로컬 저장 시 파일 객체 복사 청크 크기
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# S3 클라이언트 커넥션 풀 크기 (botocore 기본 10)
+# 스레드풀에서 동시에 호출되고 멀티파트 업로드도 파트마다 커넥션을 쓰므로,
+# 풀이 작으면 남는 커넥션을 버리고 매번 TLS 핸드셰이크를 다시 합니다.
+S3_MAX_POOL_CONNECTIONS = 50
+
 
 class S3Service:
     """S3 파일 업로드/다운로드 서비스"""
@@ -19,7 +30,8 @@ class S3Service:
                 's3',
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
+                region_name=settings.AWS_REGION,
+                config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
             )
             self.bucket_name = settings.S3_BUCKET_NAME
         else:
@@ -57,6 +69,57 @@ class S3Service:
         else:
             return await self._upload_to_local(file_content, filename, folder)
 
+    async def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        folder: str = "uploads",
+        content_type: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        파일 객체 업로드 (S3 또는 로컬)
+
+        upload_file과 같지만 bytes 대신 파일 객체를 청크 단위로 읽어 전송합니다.
+        (S3는 boto3 upload_fileobj가 큰 파일을 멀티파트로 나눠 업로드)
+
+        Args:
+            fileobj: 읽기 가능한 바이너리 파일 객체 (현재 위치부터 업로드)
+            filename: 원본 파일명
+            folder: S3 폴더 (audio, pdf, etc.)
+            content_type: MIME 타입
+
+        Returns:
+            (file_key, file_url): 파일 키와 URL
+        """
+        if settings.use_s3:
+            key = self._generate_key(folder, filename)
+
+            extra_args = {}
+            if content_type:
+                extra_args['ContentType'] = content_type
+
+            try:
+                await run_in_threadpool(
+                    self.s3_client.upload_fileobj,
+                    fileobj,
+                    self.bucket_name,
+                    key,
+                    ExtraArgs=extra_args or None
+                )
+            except ClientError as e:
+                raise Exception(f"S3 업로드 실패: {e}")
+
+            url = f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
+            return key, url
+
+        upload_dir = os.path.join(settings.UPLOAD_DIR, folder)
+        ext = os.path.splitext(filename)[1]
+        file_path = os.path.join(upload_dir, f"{uuid.uuid4().hex[:8]}{ext}")
+
+        await run_in_threadpool(self._copy_local, upload_dir, file_path, fileobj)
+
+        return file_path, file_path
+
     async def _upload_to_s3(
         self,
         file_content: bytes,
@@ -71,8 +134,10 @@ class S3Service:
         if content_type:
             extra_args['ContentType'] = content_type
 
+        # boto3는 동기 호출 → 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
         try:
-            self.s3_client.put_object(
+            await run_in_threadpool(
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=file_content,
@@ -92,9 +157,7 @@ class S3Service:
         folder: str
     ) -> Tuple[str, str]:
         """로컬에 파일 저장 (개발용)"""
-        # 폴더 생성
         upload_dir = os.path.join(settings.UPLOAD_DIR, folder)
-        os.makedirs(upload_dir, exist_ok=True)
 
         # 고유 파일명 생성
         ext = os.path.splitext(filename)[1]
@@ -102,11 +165,24 @@ class S3Service:
         new_filename = f"{unique_id}{ext}"
         file_path = os.path.join(upload_dir, new_filename)
 
-        # 파일 저장
+        # 폴더 생성 + 파일 저장 (스레드풀)
+        await run_in_threadpool(self._write_local, upload_dir, file_path, file_content)
+
+        return file_path, file_path
+
+    @staticmethod
+    def _write_local(upload_dir: str, file_path: str, file_content: bytes) -> None:
+        """로컬 파일 쓰기 (동기)"""
+        os.makedirs(upload_dir, exist_ok=True)
         with open(file_path, 'wb') as f:
             f.write(file_content)
 
-        return file_path, file_path
+    @staticmethod
+    def _copy_local(upload_dir: str, file_path: str, fileobj: BinaryIO) -> None:
+        """로컬 파일로 청크 단위 복사 (동기)"""
+        os.makedirs(upload_dir, exist_ok=True)
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(fileobj, f, COPY_CHUNK_SIZE)
 
     async def get_file(self, key: str) -> bytes:
         """
@@ -126,16 +202,25 @@ class S3Service:
     async def _get_from_s3(self, key: str) -> bytes:
         """S3에서 파일 다운로드"""
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=key
-            )
-            return response['Body'].read()
+            return await run_in_threadpool(self._read_s3_object, key)
         except ClientError as e:
             raise Exception(f"S3 다운로드 실패: {e}")
 
+    def _read_s3_object(self, key: str) -> bytes:
+        """S3 객체 읽기 (동기)"""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=key
+        )
+        return response['Body'].read()
+
     async def _get_from_local(self, path: str) -> bytes:
         """로컬에서 파일 읽기"""
+        return await run_in_threadpool(self._read_local, path)
+
+    @staticmethod
+    def _read_local(path: str) -> bytes:
+        """로컬 파일 읽기 (동기)"""
         with open(path, 'rb') as f:
             return f.read()
 
@@ -151,7 +236,8 @@ class S3Service:
         """
         if settings.use_s3:
             try:
-                self.s3_client.delete_object(
+                await run_in_threadpool(
+                    self.s3_client.delete_object,
                     Bucket=self.bucket_name,
                     Key=key
                 )
@@ -160,7 +246,7 @@ class S3Service:
                 return False
         else:
             try:
-                os.remove(key)
+                await run_in_threadpool(os.remove, key)
                 return True
             except OSError:
                 return False
@@ -7,7 +7,7 @@ Supports two input methods:
 
 from typing import Dict, List, Optional
 import re
-from app.services.pdf_service import pdf_service
+from app.services.pdf_service import pdf_service, PDFSource
 from app.schemas.script import (
     ConsultationType,
     ToneStyle,
@@ -96,21 +96,23 @@ class ScriptExtractorService:
 
         return result
 
-    def extract_from_pdf(self, file_path: str) -> Dict:
+    def extract_from_pdf(self, file_path: PDFSource, company_name: Optional[str] = None) -> Dict:
         """
         PDF 파일에서 스크립트 정보 추출
 
         Args:
-            file_path: PDF 파일 경로
+            file_path: PDF 파일 경로 (또는 PDF 바이트)
+            company_name: 회사명 (입력 시 추출 결과의 company_name으로 사용)
 
         Returns:
             추출된 스크립트 정보 딕셔너리
+            (모든 키가 항상 존재, faq/objection_responses/common_problems는 dict 리스트)
         """
         # 기존 PDF 서비스 활용
         parsed = pdf_service.parse_script_pdf(file_path)
 
         result = {
-            "company_name": "",
+            "company_name": company_name or "",
             "consultation_type": None,
             "product_name": "",
             "key_features": [],
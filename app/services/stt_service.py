@@ -40,6 +40,7 @@ class STTService:
                     }
                 ],
                 "speakers": List[str],  # ["A", "B"]
+                "utterances_by_speaker": Dict[str, List[dict]],  # utterances grouped by speaker
                 "duration": int  # milliseconds
             }
 
@@ -78,28 +79,29 @@ class STTService:
         result = response.to_dict()
 
         utterances = []
-        speakers_set = set()
+        # 화자별 발화 인덱스 (분석 전처리에서 화자 수만큼 다시 필터링하지 않도록 함께 생성)
+        utterances_by_speaker: Dict[str, List[Dict]] = {}
 
         # Get utterances from Deepgram response
         if result.get("results", {}).get("utterances"):
             for utterance in result["results"]["utterances"]:
                 speaker = self._convert_speaker_label(utterance.get("speaker", 0))
-                speakers_set.add(speaker)
-
                 # Deepgram returns seconds, convert to milliseconds
                 start_ms = int(utterance["start"] * 1000)
                 end_ms = int(utterance["end"] * 1000)
 
-                utterances.append({
+                item = {
                     "speaker": speaker,
                     "text": utterance["transcript"],
                     "start": start_ms,
                     "end": end_ms,
                     "confidence": utterance.get("confidence", 0.0)
-                })
+                }
+                utterances.append(item)
+                utterances_by_speaker.setdefault(speaker, []).append(item)
 
         # Sort speakers alphabetically
-        speakers = sorted(list(speakers_set))
+        speakers = sorted(utterances_by_speaker)
 
         # Get full text
         full_text = ""
@@ -112,6 +114,7 @@ class STTService:
             "full_text": full_text,
             "utterances": utterances,
             "speakers": speakers,
+            "utterances_by_speaker": utterances_by_speaker,
             "duration": utterances[-1]["end"] if utterances else 0
         }
 
@@ -7,7 +7,7 @@ Deepgram is much faster than AssemblyAI:
 - Near real-time processing
 """
 
-from typing import Dict, Callable, Optional, List
+from typing import Awaitable, Dict, Callable, Optional, List, Union
 import asyncio
 from deepgram import DeepgramClient, PrerecordedOptions, FileSource
 from app.core.config import settings
@@ -36,7 +36,7 @@ class AsyncSTTService:
         self,
         audio_file_path: str,
         language_code: str = "ko",
-        progress_callback: Optional[Callable[[int, str], None]] = None,
+        progress_callback: Optional[Callable[[int, str], Union[None, Awaitable[None]]]] = None,
         keywords: Optional[List[str]] = None
     ) -> Dict:
         """
@@ -45,7 +45,7 @@ class AsyncSTTService:
         Args:
             audio_file_path: Path to audio file
             language_code: Language code (default: "ko")
-            progress_callback: Callback function(percent, message)
+            progress_callback: Callback function(percent, message) - async 함수면 전송이 끝날 때까지 await
             keywords: Custom keywords for better recognition (e.g., ["회사명:5"])
 
         Returns:
@@ -59,13 +59,6 @@ class AsyncSTTService:
         if progress_callback:
             await self._call_callback(progress_callback, 10, "파일 읽는 중...")
 
-        with open(audio_file_path, "rb") as f:
-            buffer_data = f.read()
-
-        payload: FileSource = {
-            "buffer": buffer_data,
-        }
-
         # Step 2: Configure and start transcription (20%)
         if progress_callback:
             await self._call_callback(progress_callback, 20, "Deepgram 전사 시작...")
@@ -84,12 +77,16 @@ class AsyncSTTService:
         if progress_callback:
             await self._call_callback(progress_callback, 30, "전사 처리 중...")
 
+        # 파일을 메모리에 통째로 읽지 않고 스트림으로 전달 → 디스크 읽기와 Deepgram 업로드가 겹쳐서 진행
+        # (Deepgram SDK는 동기식이므로 파일 열기/업로드 모두 executor 스레드에서 실행)
+        def _transcribe():
+            with open(audio_file_path, "rb") as f:
+                payload: FileSource = {"stream": f}
+                return self.client.listen.rest.v("1").transcribe_file(payload, options)
+
         # Deepgram is synchronous but very fast, run in executor
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.listen.rest.v("1").transcribe_file(payload, options)
-        )
+        response = await loop.run_in_executor(None, _transcribe)
 
         if progress_callback:
             await self._call_callback(progress_callback, 80, "전사 완료, 결과 처리 중...")
@@ -104,7 +101,7 @@ class AsyncSTTService:
 
     async def _call_callback(
         self,
-        callback: Callable[[int, str], None],
+        callback: Callable[[int, str], Union[None, Awaitable[None]]],
         percent: int,
         message: str
     ):
@@ -121,28 +118,29 @@ class AsyncSTTService:
         result = response.to_dict()
 
         utterances = []
-        speakers_set = set()
+        # 화자별 발화 인덱스 (분석 전처리에서 화자 수만큼 다시 필터링하지 않도록 함께 생성)
+        utterances_by_speaker: Dict[str, List[Dict]] = {}
 
         # Get utterances from Deepgram response
         if result.get("results", {}).get("utterances"):
             for utterance in result["results"]["utterances"]:
                 speaker = self._convert_speaker_label(utterance.get("speaker", 0))
-                speakers_set.add(speaker)
-
                 # Deepgram returns seconds, convert to milliseconds
                 start_ms = int(utterance["start"] * 1000)
                 end_ms = int(utterance["end"] * 1000)
 
-                utterances.append({
+                item = {
                     "speaker": speaker,
                     "text": utterance["transcript"],
                     "start": start_ms,
                     "end": end_ms,
                     "confidence": utterance.get("confidence", 0.0)
-                })
+                }
+                utterances.append(item)
+                utterances_by_speaker.setdefault(speaker, []).append(item)
 
         # Sort speakers alphabetically
-        speakers = sorted(list(speakers_set))
+        speakers = sorted(utterances_by_speaker)
 
         # Get full text
         full_text = ""
@@ -155,9 +153,14 @@ class AsyncSTTService:
             "full_text": full_text,
             "utterances": utterances,
             "speakers": speakers,
+            "utterances_by_speaker": utterances_by_speaker,
             "duration": utterances[-1]["end"] if utterances else 0
         }
 
     def _convert_speaker_label(self, speaker_num: int) -> str:
         """Convert Deepgram speaker number to simple letter (0->A, 1->B, etc.)"""
         return chr(65 + speaker_num)  # 65 is ASCII for 'A'
+
+
+# Global instance (Deepgram 클라이언트를 요청마다 새로 만들지 않고 재사용)
+async_stt_service = AsyncSTTService()
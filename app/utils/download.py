@@ -0,0 +1,82 @@
+"""원격 파일 다운로드 유틸리티"""
+
+from pathlib import Path
+from typing import Optional
+import aiofiles
+import httpx
+
+from app.core.exceptions import FileSizeExceededError
+
+# 다운로드 청크 크기 (메모리에는 청크 하나만 유지)
+CHUNK_SIZE = 64 * 1024
+
+# 연결/청크 수신 타임아웃 (응답을 아주 느리게 보내는 서버에 워커가 묶이지 않도록)
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 30.0
+
+# 공유 HTTP 클라이언트 (S3 샘플처럼 같은 호스트로 반복되는 다운로드의 TCP/TLS 연결 재사용)
+# 첫 사용 시 생성, 앱 종료 시 close_http_client()로 정리
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 반환 (없거나 닫혔으면 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (앱 종료 시)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def download_to_file(
+    url: str,
+    file_path: Path,
+    timeout: float = 120.0,
+    max_bytes: Optional[int] = None
+) -> int:
+    """
+    URL의 파일을 디스크로 스트리밍 다운로드
+
+    응답 전체를 메모리에 올리지 않고 청크 단위로 받아 바로 기록합니다.
+    max_bytes를 넘으면 Content-Length만 보고 바로, 또는 수신 도중에 중단합니다.
+
+    Args:
+        url: 다운로드할 파일 URL
+        file_path: 저장 경로
+        timeout: 요청 타임아웃 (초)
+        max_bytes: 최대 허용 크기 (None이면 제한 없음)
+
+    Returns:
+        size: 저장된 바이트 수
+
+    Raises:
+        httpx.HTTPError: 다운로드 실패 시
+        FileSizeExceededError: max_bytes 초과 시 (일부 기록된 파일은 호출 측에서 삭제)
+    """
+    size = 0
+    timeouts = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT, read=READ_TIMEOUT)
+    async with _get_http_client().stream("GET", url, timeout=timeouts) as response:
+        response.raise_for_status()
+
+        if max_bytes is not None:
+            declared = response.headers.get("content-length")
+            if declared and declared.isdigit() and int(declared) > max_bytes:
+                raise FileSizeExceededError(max_bytes // 1024 // 1024)
+
+        async with aiofiles.open(file_path, "wb") as f:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileSizeExceededError(max_bytes // 1024 // 1024)
+                await f.write(chunk)
+    return size
@@ -0,0 +1,126 @@
+"""업로드 파일(UploadFile) 처리 유틸리티"""
+
+from pathlib import Path
+from typing import Optional, Union
+import base64
+import os
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.core.exceptions import FileSizeExceededError
+
+# 업로드 복사 청크 크기 (메모리에는 청크 하나만 유지)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# base64 디코딩 청크 크기 (4의 배수 → 청크 경계에서 바이트가 나뉘지 않음, 디코딩 후 3MB)
+BASE64_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def get_scratch_dir() -> Path:
+    """
+    임시 음성 파일 디렉터리 (없으면 생성)
+
+    요청마다 확인합니다 - 실행 중 디렉터리가 삭제되어도(/tmp 정리 등) 다음 업로드에서 다시 생성
+    """
+    path = Path(settings.scratch_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def is_pdf_filename(filename: Optional[str]) -> bool:
+    """파일명 확장자가 .pdf인지 확인 (파일명 없음 → False)"""
+    if not filename:
+        return False
+    _, dot, ext = filename.rpartition(".")
+    return bool(dot) and ext.lower() == "pdf"
+
+
+async def remove_file(file_path: Union[str, Path]) -> None:
+    """파일이 있으면 삭제 (스레드에서 실행 → 느린 디스크에서도 이벤트 루프를 막지 않음)"""
+    try:
+        await aiofiles.os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def get_upload_size(file: UploadFile) -> int:
+    """
+    업로드 파일 크기 (본문을 읽지 않고 확인)
+
+    Starlette가 요청을 파싱하며 기록한 크기를 사용하고, 없으면 임시 파일 끝 위치로 계산합니다.
+    """
+    if file.size is not None:
+        return file.size
+
+    f = file.file
+    position = f.tell()
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(position)
+    return size
+
+
+async def save_upload_file(
+    file: UploadFile,
+    file_path: Union[str, Path],
+    max_bytes: Optional[int] = None
+) -> int:
+    """
+    UploadFile을 청크 단위로 디스크에 저장
+
+    본문 전체를 bytes로 읽지 않으므로 동시 업로드가 많아도 요청당 메모리는 청크 하나입니다.
+
+    Args:
+        file: 업로드 파일
+        file_path: 저장 경로
+        max_bytes: 최대 허용 크기 (None이면 제한 없음)
+
+    Returns:
+        size: 저장된 바이트 수
+
+    Raises:
+        FileSizeExceededError: max_bytes 초과 시 (일부 기록된 파일은 호출 측에서 삭제)
+    """
+    size = 0
+    await file.seek(0)
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                raise FileSizeExceededError(max_bytes // 1024 // 1024)
+            await f.write(chunk)
+    return size
+
+
+def base64_decoded_size(data: str) -> int:
+    """base64 문자열을 디코딩하지 않고 디코딩 후 바이트 수 계산 (4문자 → 3바이트, 끝 패딩 제외)"""
+    tail = data[-2:]
+    return len(data) * 3 // 4 - (len(tail) - len(tail.rstrip("=")))
+
+
+async def save_base64_file(data: str, file_path: Union[str, Path]) -> int:
+    """
+    base64 문자열을 청크 단위로 디코딩하며 디스크에 저장
+
+    디코딩 결과 전체를 bytes로 만들지 않으므로 원본 문자열 외 추가 메모리는 청크 하나입니다.
+    (공백/줄바꿈 없는 표준 base64 - 브라우저 btoa 출력 기준)
+
+    Args:
+        data: base64 문자열
+        file_path: 저장 경로
+
+    Returns:
+        size: 저장된 바이트 수
+
+    Raises:
+        binascii.Error: 잘못된 base64 데이터 (일부 기록된 파일은 호출 측에서 삭제)
+    """
+    size = 0
+    async with aiofiles.open(file_path, "wb") as f:
+        for start in range(0, len(data), BASE64_CHUNK_SIZE):
+            chunk = base64.b64decode(data[start:start + BASE64_CHUNK_SIZE])
+            size += len(chunk)
+            await f.write(chunk)
+    return size
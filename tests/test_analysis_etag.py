@@ -0,0 +1,94 @@
+"""Tests for analysis response ETag revalidation"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import analysis
+from app.core.cache import ResultCache
+from app.main import app
+from app.schemas.analysis import AISummaryResponse, CustomerState
+
+SUMMARY_URL = "/api/v1/analysis/summary"
+
+REQUEST_BODY = {
+    "utterances": [
+        {"speaker": "A", "text": "안녕하세요, 콜메이트입니다.", "start": 0, "end": 1000},
+        {"speaker": "B", "text": "요금제 문의드리려고요.", "start": 1000, "end": 2000}
+    ],
+    "speakers": ["A", "B"],
+    "my_speaker": "A"
+}
+
+
+@pytest.fixture
+def summary_calls(monkeypatch):
+    """Stub the summary LLM call and record each invocation"""
+    calls = []
+
+    async def generate_summary(transcript_id, conversation_formatted, customer_text):
+        calls.append(transcript_id)
+        return AISummaryResponse(
+            transcript_id=transcript_id,
+            summary="요금제 문의",
+            customer_state=CustomerState.INTERESTED
+        )
+
+    monkeypatch.setattr(analysis.analysis_service, "generate_summary", generate_summary)
+    return calls
+
+
+@pytest.fixture
+def client(monkeypatch, summary_calls):
+    """TestClient with fresh result/preprocessing caches"""
+    monkeypatch.setattr(analysis, "result_cache", ResultCache())
+    monkeypatch.setattr(analysis, "prepared_cache", analysis.TTLCache(maxsize=16, ttl=60))
+    return TestClient(app)
+
+
+def test_etag_round_trip(client, summary_calls):
+    """Test a repeated request with the returned ETag gets 304 without a body"""
+    first = client.post(SUMMARY_URL, json=REQUEST_BODY)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert first.headers["Cache-Control"] == analysis.CACHE_CONTROL
+    assert first.json()["summary"] == "요금제 문의"
+
+    second = client.post(SUMMARY_URL, json=REQUEST_BODY, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+    # The second request is answered from the cached result (no second LLM call)
+    assert summary_calls == ["from_request"]
+
+
+@pytest.mark.parametrize("header", [
+    "{etag}",
+    "W/{etag}",
+    '"stale", {etag}',
+    '"stale",W/{etag} ',
+    "*",
+    " * "
+])
+def test_if_none_match_matches(client, header):
+    """Test strong, weak, listed and wildcard If-None-Match values match"""
+    etag = client.post(SUMMARY_URL, json=REQUEST_BODY).headers["ETag"]
+
+    response = client.post(
+        SUMMARY_URL, json=REQUEST_BODY, headers={"If-None-Match": header.format(etag=etag)}
+    )
+
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("header", ['"stale"', 'W/"stale", "other"'])
+def test_if_none_match_mismatch_returns_body(client, header):
+    """Test a non-matching If-None-Match returns the full response"""
+    first = client.post(SUMMARY_URL, json=REQUEST_BODY)
+
+    response = client.post(SUMMARY_URL, json=REQUEST_BODY, headers={"If-None-Match": header})
+
+    assert response.status_code == 200
+    assert response.content == first.content
+    assert response.headers["ETag"] == first.headers["ETag"]
@@ -1,7 +1,17 @@
 """Tests for prompt manager"""
 
 import pytest
-from app.core.prompt_manager import PromptManager, get_prompt
+from app.core.prompt_manager import PromptManager, PROMPT_CACHE_SIZE, get_prompt
+
+
+@pytest.fixture
+def tmp_prompts(tmp_path):
+    """PromptManager over a temporary prompts directory"""
+    def write(name: str, content: str) -> str:
+        (tmp_path / name).write_text(content, encoding="utf-8")
+        return name
+
+    return PromptManager(prompts_dir=str(tmp_path)), write
 
 
 def test_load_prompt():
@@ -127,3 +137,61 @@ def test_multiple_variables():
         assert value in rendered
         # No unreplaced variables
         assert f"{{{{{key}}}}}" not in rendered
+
+
+def test_render_keeps_unknown_variables(tmp_prompts):
+    """Test placeholders without a value are left as written"""
+    pm, write = tmp_prompts
+    path = write("partial.md", "{{known}} / {{unknown}}")
+
+    rendered = pm.render_prompt(path, {"known": "값"})
+
+    assert rendered == "값 / {{unknown}}"
+
+
+def test_render_inserts_backslashes_literally(tmp_prompts):
+    """Test values are inserted as-is, not as regex replacement templates"""
+    pm, write = tmp_prompts
+    path = write("escape.md", "path={{path}}")
+
+    rendered = pm.render_prompt(path, {"path": r"C:\new\1 \g<0>"})
+
+    assert rendered == r"path=C:\new\1 \g<0>"
+
+
+def test_render_does_not_substitute_inside_values(tmp_prompts):
+    """Test a value containing {{other}} is not rendered again"""
+    pm, write = tmp_prompts
+    path = write("nested.md", "{{first}} | {{second}}")
+
+    rendered = pm.render_prompt(path, {"first": "{{second}}", "second": "B"})
+
+    assert rendered == "{{second}} | B"
+
+
+def test_cache_info(tmp_prompts):
+    """Test cache_info reports cached count and capacity"""
+    pm, write = tmp_prompts
+    assert pm.cache_info() == {"size": 0, "maxsize": PROMPT_CACHE_SIZE}
+
+    pm.load_prompt(write("a.md", "A"))
+    pm.load_prompt(write("b.md", "B"))
+
+    assert pm.cache_info() == {"size": 2, "maxsize": PROMPT_CACHE_SIZE}
+
+
+def test_cache_evicts_least_recently_used(tmp_prompts):
+    """Test the cache is bounded and evicts the least recently used prompt"""
+    pm, write = tmp_prompts
+    paths = [write(f"p{i}.md", f"prompt {i}") for i in range(PROMPT_CACHE_SIZE + 1)]
+
+    for path in paths[:PROMPT_CACHE_SIZE]:
+        pm.load_prompt(path)
+    # Touch the oldest entry so the second one becomes least recently used
+    pm.load_prompt(paths[0])
+    pm.load_prompt(paths[-1])
+
+    assert pm.cache_info()["size"] == PROMPT_CACHE_SIZE
+    assert paths[0] in pm._cache
+    assert paths[1] not in pm._cache
+    assert paths[-1] in pm._cache
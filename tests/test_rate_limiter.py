@@ -0,0 +1,93 @@
+"""Tests for IP rate limiter daily reset"""
+
+from datetime import datetime, timezone
+
+import pytest
+from starlette.requests import Request
+
+from app.core import rate_limiter as rate_limiter_module
+from app.core.rate_limiter import KST, IPRateLimiter
+
+
+def make_request(ip: str) -> Request:
+    """Minimal HTTP request from the given client IP"""
+    return Request({"type": "http", "headers": [], "client": (ip, 12345)})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable clock shared by datetime.now and time.time in the rate limiter"""
+    current = {"now": datetime(2026, 10, 15, 12, 0, tzinfo=KST)}
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return current["now"].astimezone(tz)
+
+    def set_time(value: datetime) -> None:
+        current["now"] = value
+
+    monkeypatch.setattr(rate_limiter_module, "datetime", FrozenDatetime)
+    monkeypatch.setattr(rate_limiter_module.time, "time", lambda: current["now"].timestamp())
+    return set_time
+
+
+def test_usage_cleared_after_reset_time(clock):
+    """Test all usage is cleared once time passes _reset_at"""
+    limiter = IPRateLimiter()
+    limiter.record_usage(make_request("1.1.1.1"), 10 * 60 * 1000)
+    limiter.record_usage(make_request("2.2.2.2"), 5 * 60 * 1000)
+
+    clock(datetime.fromtimestamp(limiter._reset_at + 1, KST))
+
+    remaining = limiter.get_remaining(make_request("1.1.1.1"))
+    assert remaining["used_duration_ms"] == 0
+    assert remaining["remaining_duration_min"] == 30
+    # Every IP is cleared at once, not only the one that made the request
+    assert limiter.usage == {}
+
+
+def test_usage_kept_before_reset_time(clock):
+    """Test usage is kept until the reset time is reached"""
+    limiter = IPRateLimiter()
+    limiter.record_usage(make_request("1.1.1.1"), 10 * 60 * 1000)
+    reset_at = limiter._reset_at
+
+    clock(datetime.fromtimestamp(reset_at - 1, KST))
+
+    assert limiter.get_remaining(make_request("1.1.1.1"))["used_duration_ms"] == 10 * 60 * 1000
+    assert limiter._reset_at == reset_at
+
+
+def test_reset_at_kst_midnight_boundary(clock):
+    """Test usage recorded just before KST midnight is cleared exactly at midnight"""
+    clock(datetime(2026, 10, 15, 23, 59, 59, tzinfo=KST))
+    limiter = IPRateLimiter()
+    limiter.record_usage(make_request("1.1.1.1"), 20 * 60 * 1000)
+    assert limiter._reset_at == datetime(2026, 10, 16, tzinfo=KST).timestamp()
+
+    clock(datetime(2026, 10, 16, 0, 0, 0, tzinfo=KST))
+    limiter.record_usage(make_request("1.1.1.1"), 60 * 1000)
+
+    assert limiter.usage == {"1.1.1.1": 60 * 1000}
+    # The next reset is recomputed for the following KST midnight
+    assert limiter._reset_at == datetime(2026, 10, 17, tzinfo=KST).timestamp()
+
+
+@pytest.mark.parametrize("now, expected", [
+    # 23:59:59 KST is still the same KST day
+    (datetime(2026, 10, 15, 23, 59, 59, tzinfo=KST), datetime(2026, 10, 16, tzinfo=KST)),
+    # Exactly midnight belongs to the new day
+    (datetime(2026, 10, 16, 0, 0, 0, tzinfo=KST), datetime(2026, 10, 17, tzinfo=KST)),
+    # 15:30 UTC is already the next day in KST
+    (datetime(2026, 10, 15, 15, 30, tzinfo=timezone.utc), datetime(2026, 10, 17, tzinfo=KST)),
+    # 14:59 UTC is still the same day in KST
+    (datetime(2026, 10, 15, 14, 59, tzinfo=timezone.utc), datetime(2026, 10, 16, tzinfo=KST)),
+    # Month and year rollover
+    (datetime(2026, 12, 31, 23, 0, tzinfo=KST), datetime(2027, 1, 1, tzinfo=KST)),
+])
+def test_next_kst_midnight(clock, now, expected):
+    """Test the next KST midnight is computed in KST regardless of the server timezone"""
+    clock(now)
+
+    assert IPRateLimiter()._get_next_kst_midnight() == expected.timestamp()
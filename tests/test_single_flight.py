@@ -0,0 +1,127 @@
+"""Tests for analysis request coalescing (_single_flight)"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from app.api.v1 import analysis
+from app.core.cache import ResultCache
+
+
+class Result(BaseModel):
+    value: str
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    """Fresh in-process result cache for each test"""
+    cache = ResultCache()
+    monkeypatch.setattr(analysis, "result_cache", cache)
+    return cache
+
+
+def test_concurrent_requests_compute_once(local_cache):
+    """Test N concurrent identical requests share a single compute call"""
+    calls = 0
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return Result(value="ok")
+
+        waiters = [
+            asyncio.ensure_future(analysis._single_flight("same-key", compute))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*waiters)
+
+    bodies = asyncio.run(scenario())
+
+    assert calls == 1
+    assert bodies == [b'{"value":"ok"}'] * 5
+    assert "same-key" not in analysis._inflight
+    assert asyncio.run(local_cache.get("same-key")) == b'{"value":"ok"}'
+
+
+def test_failed_compute_reaches_every_waiter(local_cache):
+    """Test a failed compute is raised to all waiters and the in-flight entry is removed"""
+    async def scenario():
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            raise RuntimeError("LLM failed")
+
+        waiters = [
+            asyncio.ensure_future(analysis._single_flight("failing-key", compute))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 3
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert "failing-key" not in analysis._inflight
+    assert asyncio.run(local_cache.get("failing-key")) is None
+
+
+def test_cancelled_caller_does_not_cancel_computation(local_cache):
+    """Test cancelling one caller leaves the shared computation running for the others"""
+    completed = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            completed.append(True)
+            return Result(value="shared")
+
+        first = asyncio.ensure_future(analysis._single_flight("shared-key", compute))
+        second = asyncio.ensure_future(analysis._single_flight("shared-key", compute))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        body = await second
+        return first, body
+
+    first, body = asyncio.run(scenario())
+
+    assert first.cancelled()
+    assert completed == [True]
+    assert body == b'{"value":"shared"}'
+    assert "shared-key" not in analysis._inflight
+
+
+def test_computation_finishes_after_only_caller_disconnects(local_cache):
+    """Test the result is still cached when the only caller is cancelled"""
+    async def scenario():
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            return Result(value="late")
+
+        caller = asyncio.ensure_future(analysis._single_flight("orphan-key", compute))
+        await asyncio.sleep(0)
+        shared = analysis._inflight["orphan-key"]
+        caller.cancel()
+
+        release.set()
+        await asyncio.wait_for(shared, timeout=1)
+        return await local_cache.get("orphan-key")
+
+    assert asyncio.run(scenario()) == b'{"value":"late"}'